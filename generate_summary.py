@@ -4,11 +4,35 @@ Generate JSON data and Vue.js HTML summary of price lists from the cenniky folde
 Parses PDF content to extract manufacturer, model, base prices, and validity dates.
 """
 
+import io
+import os
 import re
+import sys
+import tarfile
+import zipfile
 import json
-from datetime import datetime
-from pathlib import Path
-from collections import defaultdict
+import gzip
+import hashlib
+import argparse
+import mimetypes
+import threading
+import queue
+import tracemalloc
+import unicodedata
+import zlib
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timedelta
+from pathlib import Path, PurePosixPath
+from collections import defaultdict, deque
+from operator import attrgetter
+from html import unescape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
 
 try:
     import pypdf
@@ -17,21 +41,619 @@ except ImportError:
     PDF_PARSING_AVAILABLE = False
     print("Warning: pypdf not installed. Run: pip install pypdf")
 
+# Keywords for content-based make/model detection. Brand keywords only identify
+# the make; model keywords are named by parse_filename(), so records detected
+# from content join the same model groups as their filename-classified siblings.
+CONTENT_MAKE_KEYWORDS = {
+    'volkswagen': 'Volkswagen',
+    'ford': 'Ford',
+    'opel': 'Opel',
+    'peugeot': 'Peugeot',
+    'toyota': 'Toyota',
+    'citroën': 'Citroën',
+    'citroen': 'Citroën',
+}
+CONTENT_MODEL_KEYWORDS = (
+    'california', 'caravelle', 'multivan', 'transporter',
+    'transit custom',
+    'vivaro', 'vivaro van', 'vivaro combi', 'zafira',
+    'expert', 'expert furgon', 'expert combi', 'expert traveller',
+    'proace', 'proace verso', 'proace verso ev',
+    'spacetourer', 'space tourer',
+)
+
+# Model year markers, each followed directly by a year in MODEL_YEAR_RANGE
+MODEL_YEAR_MARKERS = ('mj', 'mj ', 'my', 'my ', 'modelový rok ', 'model year ')
+MODEL_YEAR_RANGE = (2020, 2030)
+
+# Minimum confidence for content detection to override an unknown filename
+DETECTION_MIN_CONFIDENCE = 0.5
+
+# Characters of extracted text scanned when the first text page names no model
+DETECTION_TEXT_LIMIT = 4000
+
+# Variant keywords, matched case-insensitively in one pass (spaces may vary),
+# plus L1H1-L3H3 body sizes; counts are kept per canonical spelling.
+# The first-letter lookahead skips most positions before trying the alternation.
+VARIANT_KEYWORDS = (
+    'Active', 'Comfort', 'Premium', 'Luxury', 'Sport', 'Base',
+    'Beach', 'Coast', 'Ocean', 'Edition',
+    'Van', 'Combi', 'Kombi', 'Furgon', 'Traveller', 'Crew Van', 'Crew Cab',
+    'Short', 'Long', 'Extra Long',
+)
+VARIANT_NAMES = {keyword.replace(' ', '').lower(): keyword for keyword in VARIANT_KEYWORDS}
+VARIANT_PATTERN = re.compile(
+    r'\b(?=[' + ''.join(sorted({keyword[0].lower() for keyword in VARIANT_KEYWORDS} | {'l'})) + r'])('
+    + '|'.join(
+        [re.escape(keyword).replace(r'\ ', r'\s*') for keyword in sorted(VARIANT_KEYWORDS, key=len, reverse=True)]
+        + [r'L[123]H[123]']
+    ) + r')\b',
+    re.IGNORECASE
+)
+MAX_VARIANTS = 5
+
+# Fingerprinted CSS/JS are written to docs/<ASSETS_DIR>/
+ASSETS_DIR = 'assets'
+FINGERPRINT_LENGTH = 10
+
+# Price lists embedded in index.html when the catalog is too big to inline whole
+FIRST_SCREEN_PRICE_LISTS = 20
+
+# Static pages: one per manufacturer, plus one per model with more price lists than this
+STATIC_MODEL_PAGE_SIZE = 50
+
+# Build caches (rendered fragments etc.), kept out of docs/
+CACHE_DIR = '.cache'
+
+# Parsed records waiting to be written; bounds memory when writing falls behind
+RECORD_QUEUE_SIZE = 8
+_END_OF_STREAM = object()
+
+# Archive inputs whose PDF members are read directly (zip and tar, optionally compressed)
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+_open_archives = {}
+_archive_lock = threading.Lock()
+
+# Number of previous catalog versions that get a delta file to the current one
+MAX_DELTA_VERSIONS = 5
+
+# Set by --memprofile; see profile_stage()
+_memory_profiler = None
+
+
+class MemoryProfiler:
+    """
+    Opt-in (--memprofile) memory profiling. Records, per file and per stage,
+    the peak traced allocation size, the net allocation left behind, how far
+    the stage raised the process RSS high-water mark, the change in current
+    RSS and the top allocating source lines (via tracemalloc).
+    """
+    
+    def __init__(self, top_allocators=5):
+        self.top_allocators = top_allocators
+        self.entries = []
+        tracemalloc.start()
+    
+    @staticmethod
+    def _snapshot():
+        # Leave out tracemalloc's own bookkeeping
+        return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    
+    @contextmanager
+    def stage(self, stage, label):
+        """Profile the enclosed block as `stage` of `label` (file name or 'emit')."""
+        before = self._snapshot()
+        start_current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        start_rss_peak, start_rss = peak_rss(), current_rss()
+        try:
+            yield
+        finally:
+            end_rss_peak, end_rss = peak_rss(), current_rss()
+            current, peak = tracemalloc.get_traced_memory()
+            after = self._snapshot()
+            allocators = [
+                (str(stat.traceback[0]), stat.size_diff, stat.count_diff)
+                for stat in after.compare_to(before, 'lineno')[:self.top_allocators]
+                if stat.size_diff > 0
+            ]
+            self.entries.append({
+                'label': label,
+                'stage': stage,
+                'peak': peak - start_current,
+                'net': current - start_current,
+                'rss_growth': end_rss_peak - start_rss_peak if start_rss_peak is not None else None,
+                'rss_delta': end_rss - start_rss if start_rss is not None else None,
+                'allocators': allocators
+            })
+    
+    def write_report(self, output_path):
+        """Write a text report ranking stages and files by peak memory."""
+        def mib(size):
+            return f"{size / (1024 * 1024):9.2f} MiB" if size is not None else '        n/a'
+        
+        ranked = sorted(self.entries, key=lambda entry: entry['peak'], reverse=True)
+        per_file = defaultdict(int)
+        rss_per_file = defaultdict(int)
+        for entry in self.entries:
+            per_file[entry['label']] = max(per_file[entry['label']], entry['peak'])
+            rss_per_file[entry['label']] += entry['rss_growth'] or 0
+        
+        lines = [
+            'Memory profile',
+            f"Generated: {datetime.now().isoformat(timespec='seconds')}",
+            f"Process peak RSS: {mib(peak_rss()).strip()}",
+            '',
+            'Peak traced memory per file (max over its stages):',
+        ]
+        for rank, (label, peak) in enumerate(sorted(per_file.items(), key=lambda item: item[1], reverse=True), 1):
+            lines.append(f"{rank:4}. {mib(peak)}  {label}")
+        
+        if peak_rss() is not None:
+            lines += ['', 'RSS high-water mark raised per file (sum over its stages; 0 = stayed below earlier peaks):']
+            for rank, (label, growth) in enumerate(sorted(rss_per_file.items(), key=lambda item: item[1], reverse=True), 1):
+                lines.append(f"{rank:4}. {mib(growth)}  {label}")
+        
+        lines += ['', 'Stages ranked by peak traced memory (net = still allocated after the stage, '
+                      'RSS peak+ = high-water mark raised, RSS delta = change in current RSS):']
+        for rank, entry in enumerate(ranked, 1):
+            lines.append(f"{rank:4}. peak {mib(entry['peak'])}  net {mib(entry['net'])}  "
+                         f"RSS peak+ {mib(entry['rss_growth'])}  RSS delta {mib(entry['rss_delta'])}  "
+                         f"{entry['stage']:<18} {entry['label']}")
+            for location, size, count in entry['allocators']:
+                lines.append(f"          {mib(size)}  {count:+7} blocks  {location}")
+        
+        Path(output_path).write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        tracemalloc.stop()
+        print(f"Memory profile written: {output_path}")
+
+
+def peak_rss():
+    """Return the peak resident set size of this process in bytes (None if unknown)."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
 
-def extract_pdf_text(pdf_path, max_pages=5):
-    """Extract text from first few pages of PDF."""
+
+def current_rss():
+    """Return the current resident set size of this process in bytes (None if unknown)."""
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf('SC_PAGE_SIZE')
+
+
+def profile_stage(stage, label):
+    """Context manager profiling a stage when --memprofile is active, else a no-op."""
+    if _memory_profiler is None:
+        return nullcontext()
+    return _memory_profiler.stage(stage, label)
+
+
+def extract_pdf_pages(pdf_path, max_pages=5):
+    """Extract text of the first few pages of PDF, one string per page."""
     if not PDF_PARSING_AVAILABLE:
-        return ""
+        return []
     
+    label = Path(getattr(pdf_path, 'name', pdf_path)).name
     try:
-        reader = pypdf.PdfReader(pdf_path)
-        text = ""
-        for i in range(min(max_pages, len(reader.pages))):
-            text += reader.pages[i].extract_text() + "\n"
-        return text
+        with profile_stage('PdfReader', label):
+            reader = pypdf.PdfReader(pdf_path)
+        with profile_stage('extract_text', label):
+            return [reader.pages[i].extract_text() for i in range(min(max_pages, len(reader.pages)))]
     except Exception as e:
         print(f"Error reading {pdf_path}: {e}")
-        return ""
+        return []
+
+
+class PdfTrailerReader:
+    """
+    Minimal PDF reader for quick scans. It follows startxref through the
+    cross-reference sections (tables, streams and hybrids, along /Prev) and
+    decodes only the xref entries and objects it is asked for, where pypdf
+    parses every xref entry when a file is opened. Raises ValueError (or a parsing error) for
+    anything it does not handle, such as encryption or filters other than
+    Flate; read_pdf_info() then falls back to pypdf.
+    Parsed values: dicts and lists as such, names as '/Name' strings, strings
+    as bytes and references as (number, generation) tuples.
+    """
+    
+    WHITESPACE = re.compile(rb'(?:[\x00\t\n\x0c\r ]|%[^\r\n]*)*')
+    REGULAR = re.compile(rb'[^\x00\t\n\x0c\r ()<>\[\]{}/%]+')
+    REFERENCE = re.compile(rb'[\x00\t\n\x0c\r ]+(\d+)[\x00\t\n\x0c\r ]+R(?![^\x00\t\n\x0c\r ()<>\[\]{}/%])')
+    OBJECT_HEADER = re.compile(rb'\d+[\x00\t\n\x0c\r ]+\d+[\x00\t\n\x0c\r ]+obj')
+    XREF_SUBSECTION = re.compile(rb'(\d+)[\x00\t\n\x0c\r ]+(\d+)')
+    XREF_ENTRY = re.compile(rb'(\d{10}) +\d{5} +([nf])')
+    ESCAPES = {ord('n'): b'\n', ord('r'): b'\r', ord('t'): b'\t', ord('b'): b'\b', ord('f'): b'\f'}
+    
+    def __init__(self, data):
+        self.data = data
+        self.sections = []
+        self.object_streams = {}
+        self.trailer = self._read_xref()
+        if '/Encrypt' in self.trailer:
+            raise ValueError('encrypted PDF')
+    
+    def _skip(self, data, pos):
+        return self.WHITESPACE.match(data, pos).end()
+    
+    def parse(self, data, pos):
+        """Parse the direct object at data[pos:]; return (value, end position)."""
+        pos = self._skip(data, pos)
+        if data.startswith(b'<<', pos):
+            value = {}
+            pos = self._skip(data, pos + 2)
+            while not data.startswith(b'>>', pos):
+                key, pos = self.parse(data, pos)
+                value[key], pos = self.parse(data, pos)
+                pos = self._skip(data, pos)
+            return value, pos + 2
+        
+        char = data[pos:pos + 1]
+        if char == b'[':
+            value = []
+            pos = self._skip(data, pos + 1)
+            while not data.startswith(b']', pos):
+                item, pos = self.parse(data, pos)
+                value.append(item)
+                pos = self._skip(data, pos)
+            return value, pos + 1
+        if char == b'/':
+            match = self.REGULAR.match(data, pos + 1)
+            end = match.end() if match else pos + 1
+            name = re.sub(rb'#([0-9a-fA-F]{2})', lambda m: bytes([int(m.group(1), 16)]), data[pos + 1:end])
+            return '/' + name.decode('latin-1'), end
+        if char == b'(':
+            return self._parse_literal(data, pos + 1)
+        if char == b'<':
+            end = data.index(b'>', pos)
+            digits = re.sub(rb'\s', b'', data[pos + 1:end])
+            return bytes.fromhex((digits + b'0' * (len(digits) % 2)).decode('ascii')), end + 1
+        
+        match = self.REGULAR.match(data, pos)
+        if not match:
+            raise ValueError(f"unexpected {char!r} at {pos}")
+        token = match.group()
+        if token in (b'true', b'false'):
+            return token == b'true', match.end()
+        if token == b'null':
+            return None, match.end()
+        if token.isdigit():
+            reference = self.REFERENCE.match(data, match.end())
+            if reference:
+                return (int(token), int(reference.group(1))), reference.end()
+            return int(token), match.end()
+        return float(token), match.end()
+    
+    def _parse_literal(self, data, pos):
+        value = bytearray()
+        depth = 1
+        while True:
+            char = data[pos]
+            pos += 1
+            if char == 0x5c:  # backslash escape
+                char = data[pos]
+                pos += 1
+                if char in self.ESCAPES:
+                    value += self.ESCAPES[char]
+                elif 0x30 <= char <= 0x37:
+                    digits = re.match(rb'[0-7]{1,3}', data[pos - 1:pos + 2]).group()
+                    value.append(int(digits, 8) & 0xff)
+                    pos += len(digits) - 1
+                elif char == 0x0d:
+                    pos += data[pos:pos + 1] == b'\n'
+                elif char != 0x0a:
+                    value.append(char)
+                continue
+            if char == 0x28:
+                depth += 1
+            elif char == 0x29:
+                depth -= 1
+                if not depth:
+                    return bytes(value), pos
+            value.append(char)
+    
+    def _object_at(self, offset):
+        """Parse the indirect object at offset; return (value, decoded stream or None)."""
+        data = self.data
+        header = self.OBJECT_HEADER.match(data, self._skip(data, offset))
+        if not header:
+            raise ValueError(f"no object at {offset}")
+        value, pos = self.parse(data, header.end())
+        pos = self._skip(data, pos)
+        if not (isinstance(value, dict) and data.startswith(b'stream', pos)):
+            return value, None
+        
+        pos += 6
+        pos += 2 if data.startswith(b'\r\n', pos) else 1
+        length = self.resolve(value['/Length'])
+        return value, self._decode(value, data[pos:pos + length])
+    
+    def _decode(self, stream_dict, content):
+        filters = stream_dict.get('/Filter') or []
+        params = stream_dict.get('/DecodeParms') or []
+        if not isinstance(filters, list):
+            filters = [filters]
+        if not isinstance(params, list):
+            params = [params]
+        
+        for i, stream_filter in enumerate(filters):
+            if stream_filter not in ('/FlateDecode', '/Fl'):
+                raise ValueError(f"unsupported filter {stream_filter}")
+            content = zlib.decompressobj().decompress(content)
+            param = self.resolve(params[i]) if i < len(params) else None
+            predictor = param.get('/Predictor', 1) if param else 1
+            if predictor >= 10:
+                content = self._undo_png_predictor(content, param.get('/Columns', 1))
+            elif predictor != 1:
+                raise ValueError(f"unsupported predictor {predictor}")
+        return content
+    
+    @staticmethod
+    def _undo_png_predictor(content, columns):
+        # PNG row filters with one byte per pixel, as used by xref streams
+        output = bytearray()
+        previous = bytearray(columns)
+        for start in range(0, len(content) - columns, columns + 1):
+            kind, row = content[start], bytearray(content[start + 1:start + 1 + columns])
+            for i in range(columns):
+                left = row[i - 1] if i else 0
+                up = previous[i]
+                if kind == 1:
+                    row[i] = (row[i] + left) & 0xff
+                elif kind == 2:
+                    row[i] = (row[i] + up) & 0xff
+                elif kind == 3:
+                    row[i] = (row[i] + ((left + up) >> 1)) & 0xff
+                elif kind == 4:
+                    up_left = previous[i - 1] if i else 0
+                    estimate = left + up - up_left
+                    distances = (abs(estimate - left), abs(estimate - up), abs(estimate - up_left))
+                    row[i] = (row[i] + (left, up, up_left)[distances.index(min(distances))]) & 0xff
+            output += row
+            previous = row
+        return bytes(output)
+    
+    def _read_xref(self):
+        """
+        Index the cross-reference sections, newest first, without decoding
+        their entries; return the newest trailer.
+        """
+        startxref = re.findall(rb'startxref\s+(\d+)', self.data[-2048:])
+        if not startxref:
+            raise ValueError('startxref not found')
+        
+        newest_trailer = None
+        offset = int(startxref[-1])
+        seen = set()
+        while offset is not None and offset not in seen:
+            seen.add(offset)
+            pos = self._skip(self.data, offset)
+            if self.data.startswith(b'xref', pos):
+                trailer = self._read_xref_table(pos + 4)
+                # Hybrid files list compressed objects in a separate xref stream
+                if '/XRefStm' in trailer:
+                    self._read_xref_stream(trailer['/XRefStm'])
+            else:
+                trailer = self._read_xref_stream(offset)
+            newest_trailer = newest_trailer or trailer
+            offset = trailer.get('/Prev')
+        return newest_trailer
+    
+    def _read_xref_table(self, pos):
+        # Entries are fixed 20-byte lines, so only subsection positions are kept
+        data = self.data
+        subsections = []
+        while True:
+            pos = self._skip(data, pos)
+            if data.startswith(b'trailer', pos):
+                self.sections.append(('table', subsections))
+                return self.parse(data, pos + 7)[0]
+            subsection = self.XREF_SUBSECTION.match(data, pos)
+            if not subsection:
+                raise ValueError(f"bad xref table at {pos}")
+            first, count = int(subsection.group(1)), int(subsection.group(2))
+            pos = self._skip(data, subsection.end())
+            subsections.append((first, count, pos))
+            pos += count * 20
+    
+    def _read_xref_stream(self, offset):
+        stream_dict, content = self._object_at(offset)
+        index = stream_dict.get('/Index', [0, stream_dict['/Size']])
+        self.sections.append(('stream', stream_dict['/W'], list(zip(index[0::2], index[1::2])), content))
+        return stream_dict
+    
+    def _lookup(self, number):
+        """Return (1, offset) or (2, object stream, index) for an object in use, else None."""
+        data = self.data
+        for section in self.sections:
+            if section[0] == 'table':
+                for first, count, pos in section[1]:
+                    if first <= number < first + count:
+                        entry = self.XREF_ENTRY.match(data, pos + (number - first) * 20)
+                        if not entry:
+                            raise ValueError(f"bad xref entry for object {number}")
+                        if entry.group(2) == b'n':
+                            return 1, int(entry.group(1))
+                continue
+            
+            _, widths, ranges, content = section
+            skipped = 0
+            for first, count in ranges:
+                if first <= number < first + count:
+                    pos = (skipped + number - first) * sum(widths)
+                    fields = []
+                    for width in widths:
+                        fields.append(int.from_bytes(content[pos:pos + width], 'big'))
+                        pos += width
+                    kind = fields[0] if widths[0] else 1
+                    if kind in (1, 2):
+                        return (kind, *fields[1:])
+                skipped += count
+        return None
+    
+    def get(self, value):
+        """Resolve a reference; return (value, decoded stream or None)."""
+        if not isinstance(value, tuple):
+            return value, None
+        entry = self._lookup(value[0])
+        if entry is None:
+            return None, None
+        if entry[0] == 1:
+            return self._object_at(entry[1])
+        
+        # Objects stored in an object stream (never streams themselves)
+        _, stream_number, index = entry
+        if stream_number not in self.object_streams:
+            stream_dict, content = self.get((stream_number, 0))
+            first = stream_dict['/First']
+            header = content[:first].split()
+            self.object_streams[stream_number] = (content, [first + int(offset) for offset in header[1::2]])
+        content, offsets = self.object_streams[stream_number]
+        return self.parse(content, offsets[index])[0], None
+    
+    def resolve(self, value):
+        return self.get(value)[0]
+    
+    def read_info(self):
+        """
+        Return title, creation/modification dates (Info dictionary, then XMP)
+        and page count (/Count of the root Pages node), as read_pdf_info().
+        """
+        info = self.resolve(self.trailer.get('/Info')) or {}
+        root = self.resolve(self.trailer['/Root'])
+        result = {
+            'title': pdf_text(self.resolve(info.get('/Title'))) or None,
+            'creation_date': pdf_date(self.resolve(info.get('/CreationDate'))),
+            'modification_date': pdf_date(self.resolve(info.get('/ModDate'))),
+            'page_count': int(self.resolve(self.resolve(root['/Pages'])['/Count']))
+        }
+        
+        if not (result['title'] and result['creation_date']):
+            xmp = self.get(root.get('/Metadata'))[1]
+            if xmp:
+                xmp_info = read_xmp_info(xmp)
+                for key in ('title', 'creation_date', 'modification_date'):
+                    result[key] = result[key] or xmp_info[key]
+        return result
+
+
+def pdf_text(value):
+    """Decode a PDF text string (UTF-16 or UTF-8 with BOM, else PDFDocEncoding as Latin-1)."""
+    if not isinstance(value, bytes):
+        return None
+    if value.startswith((b'\xfe\xff', b'\xff\xfe')):
+        return value.decode('utf-16', errors='replace')
+    if value.startswith(b'\xef\xbb\xbf'):
+        return value[3:].decode('utf-8', errors='replace')
+    return value.decode('latin-1')
+
+
+def pdf_date(value):
+    """Return the YYYY-MM-DD date of a PDF date string ("D:YYYYMMDD..."), None if invalid."""
+    match = re.match(r'(?:D:)?(\d{4})(\d{2})?(\d{2})?', pdf_text(value) or '')
+    if not match:
+        return None
+    year, month, day = (int(part or 1) for part in match.groups())
+    try:
+        return datetime(year, month, day).date().isoformat()
+    except ValueError:
+        return None
+
+
+def read_xmp_info(xmp):
+    """Read dc:title and xmp:CreateDate/ModifyDate (as UTC dates) from an XMP packet."""
+    text = xmp.decode('utf-8', errors='replace')
+    
+    def xmp_date(tag):
+        match = re.search(tag + r'(?:>\s*|=["\'])(\d{4})(?:-(\d{2})(?:-(\d{2})'
+                          r'(?:T(\d{2}):(\d{2})(?::(\d{2}))?(?:\.\d+)?(Z|[+-]\d{2}:\d{2})?)?)?)?', text)
+        if not match:
+            return None
+        year, month, day, hour, minute, second, zone = match.groups()
+        try:
+            value = datetime(int(year), int(month or 1), int(day or 1), int(hour or 0), int(minute or 0), int(second or 0))
+        except ValueError:
+            return None
+        # Dates are reported in UTC, as pypdf does
+        if zone and zone != 'Z':
+            offset = timedelta(hours=int(zone[1:3]), minutes=int(zone[4:6]))
+            value = value - offset if zone[0] == '+' else value + offset
+        return value.date().isoformat()
+    
+    title = re.search(r'<dc:title>\s*<rdf:Alt>\s*<rdf:li[^>]*>([^<]*)</rdf:li>', text)
+    return {
+        'title': unescape(title.group(1)) if title and title.group(1) else None,
+        'creation_date': xmp_date('xmp:CreateDate'),
+        'modification_date': xmp_date('xmp:ModifyDate')
+    }
+
+
+def read_pdf_info(pdf_path):
+    """
+    Read document metadata without decoding any page content: title and
+    creation/modification dates from the Info dictionary (falling back to
+    XMP) and the page count from the root of the page tree. Uses
+    PdfTrailerReader, and pypdf for files it cannot handle.
+    Returns dict (dates as YYYY-MM-DD), empty if the PDF cannot be read.
+    """
+    if not PDF_PARSING_AVAILABLE:
+        return {}
+    
+    def as_date(get_value):
+        # Malformed date strings raise when converted
+        try:
+            value = get_value()
+        except Exception:
+            return None
+        return value.date().isoformat() if value else None
+    
+    def page_tree_count(reader):
+        # /Count on the root Pages node avoids flattening the whole tree
+        try:
+            count = reader.trailer['/Root']['/Pages']['/Count']
+            if int(count) > 0:
+                return int(count)
+        except Exception:
+            pass
+        return len(reader.pages)
+    
+    label = Path(getattr(pdf_path, 'name', pdf_path)).name
+    try:
+        data = pdf_path.getvalue() if isinstance(pdf_path, io.BytesIO) else Path(pdf_path).read_bytes()
+        
+        # Fast path: resolve only the trailer, Info, XMP and root Pages objects
+        try:
+            with profile_stage('PdfTrailerReader', label):
+                return PdfTrailerReader(data).read_info()
+        except Exception:
+            pass
+        
+        with profile_stage('PdfReader', label):
+            reader = pypdf.PdfReader(io.BytesIO(data), strict=False)
+            info = reader.metadata
+            result = {
+                'title': info.title if info else None,
+                'creation_date': as_date(lambda: info.creation_date) if info else None,
+                'modification_date': as_date(lambda: info.modification_date) if info else None,
+                'page_count': page_tree_count(reader)
+            }
+            
+            if not (result['title'] and result['creation_date']):
+                xmp = reader.xmp_metadata
+                if xmp:
+                    titles = xmp.dc_title or {}
+                    result['title'] = result['title'] or next(iter(titles.values()), None)
+                    result['creation_date'] = result['creation_date'] or as_date(lambda: xmp.xmp_create_date)
+                    result['modification_date'] = result['modification_date'] or as_date(lambda: xmp.xmp_modify_date)
+        return result
+    except Exception as e:
+        print(f"Error reading {label}: {e}")
+        return {}
 
 
 def extract_prices_from_text(text):
@@ -67,26 +689,20 @@ def extract_prices_from_text(text):
     return prices
 
 
-def extract_variants_from_text(text):
-    """Extract model variants from PDF text."""
-    variants = []
-    
-    # Common variant keywords
-    variant_patterns = [
-        r'\b(Active|Comfort|Premium|Luxury|Sport|Base)\b',
-        r'\b(Beach|Coast|Ocean|Edition)\b',
-        r'\b(Van|Combi|Kombi|Furgon|Traveller|Crew\s*Van|Crew\s*Cab)\b',
-        r'\b(Short|Long|Extra\s*Long|L[123]H[123])\b',
-    ]
-    
-    for pattern in variant_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            variant = match.group(1)
-            if variant not in variants:
-                variants.append(variant)
+def count_variants(text):
+    """
+    Count model variant keywords in PDF text in a single regex pass.
+    Case and spacing variants ("VAN", "Crew  van") count towards one
+    canonical name. Returns {variant: count}, most frequent first (ties
+    in order of first appearance).
+    """
+    counts = {}
+    for match in VARIANT_PATTERN.finditer(text):
+        key = re.sub(r'\s+', '', match.group(1)).lower()
+        variant = VARIANT_NAMES.get(key) or key.upper()
+        counts[variant] = counts.get(variant, 0) + 1
     
-    return variants[:5]  # Limit to first 5 unique variants
+    return dict(sorted(counts.items(), key=lambda item: -item[1]))
 
 
 def parse_pdf_content(pdf_path):
@@ -94,16 +710,148 @@ def parse_pdf_content(pdf_path):
     Parse PDF content to extract pricing and variant information.
     Returns dict with extracted data.
     """
-    text = extract_pdf_text(pdf_path, max_pages=5)
+    pages = extract_pdf_pages(pdf_path, max_pages=5)
+    text = "".join(page + "\n" for page in pages)
     
-    prices = extract_prices_from_text(text)
-    variants = extract_variants_from_text(text)
+    with profile_stage('regex', Path(getattr(pdf_path, 'name', pdf_path)).name):
+        prices = extract_prices_from_text(text)
+        variant_counts = count_variants(text)
+        # Content-based make/model, used when the filename is not recognized.
+        # Some price lists open with an image-only cover, so use the first page
+        # with text, then the start of the text if that page names no model.
+        first_page = next((page for page in pages if page.strip()), '')
+        detection = classify_text(first_page)
+        if not (detection and detection['model']):
+            detection = classify_text(text[:DETECTION_TEXT_LIMIT]) or detection
     
     return {
         'prices': prices,
-        'variants': variants,
+        'variants': list(variant_counts)[:MAX_VARIANTS],
+        'variant_counts': variant_counts,
         'base_price': prices[0] if prices else None,
-        'price_range': f"{prices[0]:,} - {prices[-1]:,} €" if len(prices) > 1 else (f"{prices[0]:,} €" if prices else None)
+        'price_range': f"{prices[0]:,} - {prices[-1]:,} €" if len(prices) > 1 else (f"{prices[0]:,} €" if prices else None),
+        'detection': detection
+    }
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton: finds all occurrences of many keywords in a single
+    linear pass over the text. Matching is case-insensitive, any run of
+    whitespace matches a single space, and only whole words are reported.
+    """
+    
+    def __init__(self, keywords):
+        # keywords: {keyword: payload}
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        
+        for keyword, payload in keywords.items():
+            keyword = re.sub(r'\s+', ' ', keyword.lower())
+            state = 0
+            for char in keyword:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.output[state].append((len(keyword), payload))
+        
+        # Breadth-first pass to set failure links and merge outputs
+        pending = deque(self.goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self.goto[state].items():
+                pending.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+    
+    def find(self, text):
+        """
+        Return whole-word matches as (start, end, payload), preferring the
+        longest keyword where matches overlap (e.g. "proace verso" over "proace").
+        Offsets refer to the text with whitespace runs collapsed.
+        """
+        text = re.sub(r'\s+', ' ', text.lower())
+        matches = []
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            for length, payload in self.output[state]:
+                start = index - length + 1
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if index + 1 < len(text) and text[index + 1].isalnum():
+                    continue
+                matches.append((start, index + 1, payload))
+        
+        # Drop matches covered by a longer one
+        matches.sort(key=lambda match: (match[0], match[0] - match[1]))
+        accepted = []
+        covered_until = 0
+        for start, end, payload in matches:
+            if start >= covered_until:
+                accepted.append((start, end, payload))
+                covered_until = end
+        return accepted
+
+
+def build_content_classifier():
+    """Build the keyword automaton used by classify_text()."""
+    keywords = {}
+    for keyword, make in CONTENT_MAKE_KEYWORDS.items():
+        keywords[keyword] = ('make', make, None)
+    for keyword in CONTENT_MODEL_KEYWORDS:
+        metadata = parse_filename(keyword)
+        keywords[keyword] = ('make', metadata['make'], metadata['model'])
+    for year in range(MODEL_YEAR_RANGE[0], MODEL_YEAR_RANGE[1] + 1):
+        for marker in MODEL_YEAR_MARKERS:
+            keywords[f"{marker}{year}"] = ('year', str(year), None)
+    return KeywordAutomaton(keywords)
+
+
+def classify_text(text):
+    """
+    Detect make, model and model year from PDF text (normally the first page).
+    Returns dict with 'make', 'model', 'model_year' and 'confidence' (0-1),
+    or None if no brand or model keyword was found.
+    """
+    make_scores = defaultdict(int)
+    model_counts = defaultdict(int)
+    year_counts = defaultdict(int)
+    
+    for _, _, (kind, value, model) in CONTENT_CLASSIFIER.find(text):
+        if kind == 'year':
+            year_counts[value] += 1
+        elif model:
+            # A model name identifies the make more reliably than the brand alone
+            make_scores[value] += 2
+            model_counts[(value, model)] += 1
+        else:
+            make_scores[value] += 1
+    
+    if not make_scores:
+        return None
+    
+    make = max(make_scores, key=make_scores.get)
+    models = {model: count for (model_make, model), count in model_counts.items() if model_make == make}
+    
+    # Share of the evidence for the winning make, damped when there is little of it
+    best_score = make_scores[make]
+    confidence = best_score / sum(make_scores.values()) * min(1.0, best_score / 4)
+    
+    return {
+        'make': make,
+        'model': max(models, key=models.get) if models else None,
+        'model_year': max(year_counts, key=year_counts.get) if year_counts else None,
+        'confidence': round(confidence, 2)
     }
 
 
@@ -218,288 +966,1126 @@ def parse_filename(filename):
     return metadata
 
 
-def generate_html(grouped_data, output_path):
-    """
-    Generate HTML summary page with embedded CSS.
-    """
-    html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Van Price Lists Summary</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
+# Built after parse_filename(), which names the model keywords
+CONTENT_CLASSIFIER = build_content_classifier()
+
+
+# Shared stylesheet for both generated pages. Written to docs/assets/ under a
+# content-fingerprinted name so it can be served with far-future cache headers.
+SUMMARY_CSS = """* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+    line-height: 1.4;
+    color: #333;
+    background: #f5f5f5;
+    padding: 10px;
+    font-size: 14px;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    background: white;
+    padding: 20px;
+    border-radius: 4px;
+    box-shadow: 0 1px 4px rgba(0,0,0,0.1);
+}
+
+h1 {
+    color: #2c3e50;
+    margin-bottom: 5px;
+    font-size: 1.8em;
+    border-bottom: 2px solid #3498db;
+    padding-bottom: 8px;
+}
+
+.subtitle {
+    color: #7f8c8d;
+    margin-bottom: 15px;
+    font-size: 0.9em;
+}
+
+.loading {
+    text-align: center;
+    padding: 20px;
+    color: #7f8c8d;
+    font-size: 1em;
+}
+
+.error {
+    text-align: center;
+    padding: 20px;
+    color: #e74c3c;
+    font-size: 1em;
+}
+
+.stats {
+    background: #ecf0f1;
+    padding: 8px;
+    border-radius: 3px;
+    margin-bottom: 15px;
+    display: flex;
+    justify-content: space-around;
+    text-align: center;
+}
+
+.stat-item {
+    flex: 1;
+}
+
+.stat-number {
+    font-size: 1.4em;
+    font-weight: bold;
+    color: #3498db;
+}
+
+.stat-label {
+    color: #7f8c8d;
+    font-size: 0.75em;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+}
+
+.make-section {
+    margin-bottom: 20px;
+}
+
+.make-header {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 8px 12px;
+    border-radius: 3px;
+    margin-bottom: 10px;
+    font-size: 1.2em;
+    font-weight: bold;
+    box-shadow: 0 1px 4px rgba(0,0,0,0.15);
+}
+
+.model-group {
+    margin-bottom: 12px;
+    background: #fafafa;
+    border-left: 3px solid #3498db;
+    padding: 10px;
+    border-radius: 2px;
+}
+
+.model-title {
+    font-size: 1.1em;
+    color: #2c3e50;
+    margin-bottom: 8px;
+    font-weight: 600;
+}
+
+.price-list {
+    list-style: none;
+}
+
+.price-list-item {
+    background: white;
+    padding: 6px 10px;
+    margin-bottom: 4px;
+    border-radius: 2px;
+    border: 1px solid #e0e0e0;
+    transition: all 0.2s ease;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    gap: 10px;
+}
+
+.price-list-item:hover {
+    border-color: #3498db;
+    box-shadow: 0 1px 4px rgba(52, 152, 219, 0.2);
+    transform: translateY(-1px);
+}
+
+.price-list-link {
+    color: #3498db;
+    text-decoration: none;
+    font-weight: 500;
+    flex-grow: 1;
+    font-size: 0.9em;
+}
+
+.price-list-link:hover {
+    color: #2980b9;
+    text-decoration: underline;
+}
+
+.metadata {
+    display: flex;
+    gap: 8px;
+    color: #7f8c8d;
+    font-size: 0.85em;
+    flex-wrap: wrap;
+}
+
+.metadata-item {
+    display: flex;
+    align-items: center;
+    gap: 4px;
+}
+
+.badge {
+    background: #ecf0f1;
+    padding: 2px 6px;
+    border-radius: 8px;
+    font-size: 0.8em;
+    font-weight: 500;
+    white-space: nowrap;
+}
+
+.badge.price {
+    background: #f3e5f5;
+    color: #6a1b9a;
+    font-weight: 600;
+}
+
+.badge.year {
+    background: #e8f5e9;
+    color: #2e7d32;
+}
+
+.badge.variant {
+    background: #e3f2fd;
+    color: #1565c0;
+}
+
+.badge.date {
+    background: #fff3e0;
+    color: #e65100;
+}
+
+.footer {
+    margin-top: 20px;
+    padding-top: 10px;
+    border-top: 1px solid #ecf0f1;
+    text-align: center;
+    color: #7f8c8d;
+    font-size: 0.8em;
+}
+
+.pager {
+    display: flex;
+    justify-content: space-between;
+    gap: 10px;
+    margin-bottom: 15px;
+    font-size: 0.9em;
+}
+
+.pager a, .model-title a {
+    color: #3498db;
+    text-decoration: none;
+}
+
+.pager a:hover, .model-title a:hover {
+    text-decoration: underline;
+}
+
+.filter {
+    width: 100%;
+    padding: 6px 10px;
+    margin-bottom: 15px;
+    border: 1px solid #e0e0e0;
+    border-radius: 3px;
+    font-size: 0.95em;
+}
+
+.hidden {
+    display: none;
+}
+"""
+
+
+# Client-side script for index.html (renders row batches from the worker).
+SUMMARY_JS = """// Client-side script for index.html. Loading, decoding, sorting and
+// filtering run in a Web Worker; this script only appends the row batches
+// it posts back, a few per animation frame, so the page stays responsive.
+
+// Row batches appended per animation frame
+const BATCHES_PER_FRAME = 2;
+
+let worker = null;
+let generation = 0;
+let pending = [];
+let frameRequested = false;
+let currentMake = null;
+let currentModel = null;
+
+// Show the error message
+function showError(err) {
+    document.getElementById('loading').classList.add('hidden');
+    const errorDiv = document.getElementById('error');
+    errorDiv.textContent = 'Error loading price list data: ' + err.message;
+    errorDiv.classList.remove('hidden');
+}
+
+// Update the statistics boxes
+function showStats(stats) {
+    document.getElementById('stat-manufacturers').textContent = stats.totalManufacturers;
+    document.getElementById('stat-models').textContent = stats.totalModels;
+    document.getElementById('stat-pricelists').textContent = stats.totalPriceLists;
+}
+
+// Append one item (rows of a make/model) to the page
+function appendItem(container, item) {
+    if (!currentMake || currentMake.dataset.make !== item.make) {
+        currentMake = document.createElement('div');
+        currentMake.className = 'make-section';
+        currentMake.dataset.make = item.make;
+        const header = document.createElement('div');
+        header.className = 'make-header';
+        header.innerHTML = item.make;
+        currentMake.appendChild(header);
+        container.appendChild(currentMake);
+        currentModel = null;
+    }
+    if (!currentModel || currentModel.dataset.model !== item.model) {
+        currentModel = document.createElement('div');
+        currentModel.className = 'model-group';
+        currentModel.dataset.model = item.model;
+        currentModel.innerHTML = `<div class="model-title">${item.model}</div><ul class="price-list"></ul>`;
+        currentMake.appendChild(currentModel);
+    }
+    currentModel.lastElementChild.insertAdjacentHTML('beforeend', item.html);
+}
+
+// Render queued batches between frames
+function renderPending() {
+    frameRequested = false;
+    const container = document.getElementById('manufacturers-container');
+    pending.splice(0, BATCHES_PER_FRAME).forEach(items => {
+        items.forEach(item => appendItem(container, item));
+    });
+    if (pending.length) {
+        frameRequested = true;
+        requestAnimationFrame(renderPending);
+    }
+}
+
+function handleWorkerMessage(event) {
+    const message = event.data;
+    if (message.type === 'error') {
+        showError(new Error(message.message));
+        return;
+    }
+    if (message.generation < generation) {
+        return;
+    }
+
+    if (message.type === 'reset') {
+        // A new (filtered or fuller) rendering starts: drop the old rows
+        generation = message.generation;
+        pending = [];
+        currentMake = null;
+        currentModel = null;
+        document.getElementById('manufacturers-container').innerHTML = '';
+    } else if (message.type === 'batch') {
+        pending.push(message.items);
+        if (!frameRequested) {
+            frameRequested = true;
+            requestAnimationFrame(renderPending);
         }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-            line-height: 1.4;
-            color: #333;
-            background: #f5f5f5;
-            padding: 10px;
-            font-size: 14px;
+    } else if (message.type === 'done') {
+        showStats(message.stats);
+
+        // Update generation date
+        const now = new Date();
+        document.getElementById('generation-date').textContent = now.toLocaleDateString('en-US', {
+            year: 'numeric',
+            month: 'long',
+            day: 'numeric'
+        });
+
+        // Show content, hide loading
+        document.getElementById('loading').classList.add('hidden');
+        document.getElementById('content').classList.remove('hidden');
+    }
+}
+
+// Start the worker and hand it the embedded catalog (if the generator inlined one)
+function loadData() {
+    try {
+        worker = new Worker(document.querySelector('script[data-worker]').dataset.worker);
+    } catch (err) {
+        showError(err);
+        return;
+    }
+    worker.onmessage = handleWorkerMessage;
+    worker.onerror = event => showError(new Error(event.message || 'Worker failed'));
+
+    const embedded = document.getElementById('catalog-data');
+    const filter = document.getElementById('filter');
+    worker.postMessage({
+        type: 'load',
+        baseUrl: document.baseURI,
+        embedded: embedded ? embedded.textContent : null,
+        query: filter.value
+    });
+
+    // Filter as the user types (debounced)
+    let filterTimer = null;
+    filter.addEventListener('input', () => {
+        clearTimeout(filterTimer);
+        filterTimer = setTimeout(() => worker.postMessage({ type: 'filter', query: filter.value }), 150);
+    });
+}
+
+// Register the service worker that keeps the page, data and opened PDFs offline
+if ('serviceWorker' in navigator && location.protocol.startsWith('http')) {
+    navigator.serviceWorker.register('sw.js').catch(err => {
+        console.warn('Service worker registration failed:', err);
+    });
+}
+
+// Open PDFs through the service worker so they are cached for offline reuse
+document.addEventListener('click', event => {
+    const link = event.target.closest('a.price-list-link');
+    if (!link || !navigator.serviceWorker || !navigator.serviceWorker.controller) {
+        return;
+    }
+    const win = window.open('', '_blank');
+    if (!win) {
+        return;
+    }
+    event.preventDefault();
+    fetch(link.href)
+        .then(response => {
+            if (!response.ok) {
+                throw new Error('Failed to load PDF');
+            }
+            return response.blob();
+        })
+        .then(blob => {
+            win.location = URL.createObjectURL(blob);
+        })
+        .catch(() => {
+            win.location = link.href;
+        });
+});
+
+// Load data when page is ready
+if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', loadData);
+} else {
+    loadData();
+}
+"""
+
+
+# Web Worker for index.html: loads, decodes, sorts and filters the catalog.
+SUMMARY_WORKER_JS = """// Web Worker for index.html: loads, decodes, sorts and filters the catalog
+// off the main thread and posts back ready-to-render batches of rows.
+
+// Price lists per posted batch
+const BATCH_SIZE = 100;
+
+// URL of the page, used to resolve data.json and delta URLs
+let baseUrl = self.location.href;
+let catalog = null;
+let generation = 0;
+// Latest filter text from the page, also kept while the catalog loads
+let query = '';
+
+// Format price with thousand separators
+function formatPrice(price) {
+    return price.toLocaleString('en-US');
+}
+
+// Format date from YYYY-MM-DD to DD.MM.YYYY
+function formatDate(dateStr) {
+    if (!dateStr) return '';
+    try {
+        const [year, month, day] = dateStr.split('-');
+        return `${day}.${month}.${year}`;
+    } catch {
+        return dateStr;
+    }
+}
+
+// Create badge HTML
+function createBadge(className, text) {
+    return `<span class="badge ${className}">${text}</span>`;
+}
+
+// Build the list item HTML for one price list
+function renderRow(priceList) {
+    let html = `<li class="price-list-item">`;
+    html += `<a href="../cenniky/${priceList.archive || priceList.filename}" class="price-list-link" target="_blank">${priceList.basename}</a>`;
+    html += `<div class="metadata">`;
+
+    if (priceList.basePrice) {
+        html += createBadge('price', `From ${formatPrice(priceList.basePrice)} €`);
+    } else if (priceList.priceRange) {
+        html += createBadge('price', priceList.priceRange);
+    }
+
+    if (priceList.modelYear) {
+        html += createBadge('year', `MY ${priceList.modelYear}`);
+    }
+
+    if (priceList.variant) {
+        html += createBadge('variant', priceList.variant);
+    }
+
+    if (priceList.validityDate) {
+        html += createBadge('date', `Valid from ${formatDate(priceList.validityDate)}`);
+    }
+
+    html += `</div>`;
+    html += `</li>`;
+    return html;
+}
+
+// Does the price list match the (lower-case) filter text?
+function matches(query, make, model, priceList) {
+    if (!query) {
+        return true;
+    }
+    return [make, model, priceList.basename, priceList.variant, priceList.modelYear]
+        .concat(priceList.variants || [])
+        .some(value => value && String(value).toLowerCase().includes(query));
+}
+
+// Filter the catalog and post it to the page in batches of rows. Each run
+// gets a new generation number so the page can drop batches of older runs.
+function render(query) {
+    const current = ++generation;
+    query = (query || '').trim().toLowerCase();
+
+    const stats = { totalManufacturers: 0, totalModels: 0, totalPriceLists: 0 };
+    let batch = [];
+    let batchRows = 0;
+
+    const flush = () => {
+        if (batch.length) {
+            self.postMessage({ type: 'batch', generation: current, items: batch });
+            batch = [];
+            batchRows = 0;
         }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 20px;
-            border-radius: 4px;
-            box-shadow: 0 1px 4px rgba(0,0,0,0.1);
+    };
+
+    self.postMessage({ type: 'reset', generation: current, partial: Boolean(catalog.partial) });
+
+    catalog.manufacturers.forEach(manufacturer => {
+        let makeMatched = false;
+        manufacturer.models.forEach(model => {
+            const rows = model.priceLists
+                .filter(priceList => matches(query, manufacturer.name, model.name, priceList))
+                .map(renderRow);
+            if (!rows.length) {
+                return;
+            }
+            makeMatched = true;
+            stats.totalModels += 1;
+            stats.totalPriceLists += rows.length;
+
+            // Large models are split over several batches
+            for (let start = 0; start < rows.length; start += BATCH_SIZE) {
+                const chunk = rows.slice(start, start + BATCH_SIZE);
+                batch.push({ make: manufacturer.name, model: model.name, html: chunk.join('') });
+                batchRows += chunk.length;
+                if (batchRows >= BATCH_SIZE) {
+                    flush();
+                }
+            }
+        });
+        if (makeMatched) {
+            stats.totalManufacturers += 1;
         }
-        
-        h1 {
-            color: #2c3e50;
-            margin-bottom: 5px;
-            font-size: 1.8em;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 8px;
+    });
+
+    flush();
+    self.postMessage({ type: 'done', generation: current, stats: query ? stats : catalog.stats });
+}
+
+// Minimal IndexedDB key/value access for the stored catalog
+function openCatalogDb() {
+    return new Promise((resolve, reject) => {
+        const request = indexedDB.open('van-price-lists', 1);
+        request.onupgradeneeded = () => request.result.createObjectStore('catalog');
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+async function getStoredCatalog() {
+    try {
+        const db = await openCatalogDb();
+        return await new Promise((resolve, reject) => {
+            const request = db.transaction('catalog').objectStore('catalog').get('current');
+            request.onsuccess = () => resolve(request.result || null);
+            request.onerror = () => reject(request.error);
+        });
+    } catch {
+        return null;
+    }
+}
+
+async function storeCatalog(data) {
+    try {
+        const db = await openCatalogDb();
+        db.transaction('catalog', 'readwrite').objectStore('catalog').put(data, 'current');
+    } catch (err) {
+        console.warn('Could not store catalog:', err);
+    }
+}
+
+async function fetchJson(url) {
+    const response = await fetch(new URL(url, baseUrl), { cache: 'no-cache' });
+    if (!response.ok) {
+        throw new Error('Failed to load ' + url);
+    }
+    return response.json();
+}
+
+// Compare helper matching the generator's ordering (plain code point order)
+function compare(a, b) {
+    return a < b ? -1 : (a > b ? 1 : 0);
+}
+
+// Apply a delta (added/changed/removed price lists) to a stored catalog
+function applyDelta(data, delta) {
+    const records = new Map();
+    data.manufacturers.forEach(manufacturer => {
+        manufacturer.models.forEach(model => {
+            model.priceLists.forEach(priceList => {
+                records.set(priceList.id, Object.assign({}, priceList, { make: manufacturer.name, model: model.name }));
+            });
+        });
+    });
+    delta.removed.forEach(id => records.delete(id));
+    delta.added.concat(delta.changed).forEach(record => records.set(record.id, record));
+
+    // Regroup by make and model; newest validity date, then model year first
+    const grouped = new Map();
+    records.forEach(record => {
+        if (!grouped.has(record.make)) {
+            grouped.set(record.make, new Map());
         }
-        
-        .subtitle {
-            color: #7f8c8d;
-            margin-bottom: 15px;
-            font-size: 0.9em;
+        const models = grouped.get(record.make);
+        if (!models.has(record.model)) {
+            models.set(record.model, []);
         }
-        
-        .make-section {
-            margin-bottom: 20px;
+        const { make, model, ...priceList } = record;
+        models.get(record.model).push(priceList);
+    });
+
+    const sortKey = priceList => (priceList.validityDate || '0000-00-00') + '|' + (priceList.modelYear || '0000');
+    const manufacturers = [...grouped.keys()].sort(compare).map(make => ({
+        name: make,
+        models: [...grouped.get(make).keys()].sort(compare).map(model => ({
+            name: model,
+            priceLists: grouped.get(make).get(model).sort((a, b) => compare(sortKey(b), sortKey(a)))
+        }))
+    }));
+
+    return {
+        version: delta.to,
+        manufacturers: manufacturers,
+        stats: {
+            totalManufacturers: manufacturers.length,
+            totalModels: manufacturers.reduce((sum, manufacturer) => sum + manufacturer.models.length, 0),
+            totalPriceLists: records.size
         }
-        
-        .make-header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 8px 12px;
-            border-radius: 3px;
-            margin-bottom: 10px;
-            font-size: 1.2em;
-            font-weight: bold;
-            box-shadow: 0 1px 4px rgba(0,0,0,0.15);
+    };
+}
+
+// Get the full catalog: from IndexedDB when it is current, by applying a
+// delta when one exists for the stored version, otherwise from data.json
+async function loadCatalog() {
+    const stored = await getStoredCatalog();
+    let current;
+    try {
+        current = await fetchJson('catalog-version.json');
+    } catch (err) {
+        if (stored) {
+            return stored;
         }
-        
-        .model-group {
-            margin-bottom: 12px;
-            background: #fafafa;
-            border-left: 3px solid #3498db;
-            padding: 10px;
-            border-radius: 2px;
+        throw err;
+    }
+
+    if (stored && stored.version === current.version) {
+        return stored;
+    }
+
+    let data = null;
+    if (stored && current.deltas[stored.version]) {
+        try {
+            data = applyDelta(stored, await fetchJson(current.deltas[stored.version]));
+        } catch (err) {
+            console.warn('Could not apply catalog delta:', err);
         }
-        
-        .model-title {
-            font-size: 1.1em;
-            color: #2c3e50;
-            margin-bottom: 8px;
-            font-weight: 600;
+    }
+    if (!data) {
+        data = await fetchJson('data.json');
+    }
+    await storeCatalog(data);
+    return data;
+}
+
+self.onmessage = async event => {
+    const message = event.data;
+    try {
+        if (message.type === 'load') {
+            baseUrl = message.baseUrl;
+            query = message.query;
+
+            // Embedded catalog from the page (raw JSON text, decoded here)
+            if (message.embedded) {
+                catalog = JSON.parse(message.embedded);
+                render(query);
+                if (!catalog.partial) {
+                    storeCatalog(catalog);
+                    return;
+                }
+            }
+
+            catalog = await loadCatalog();
+            render(query);
+        } else if (message.type === 'filter') {
+            query = message.query;
+            if (catalog) {
+                render(query);
+            }
         }
-        
-        .price-list {
-            list-style: none;
+    } catch (err) {
+        self.postMessage({ type: 'error', message: err.message });
+    }
+};
+"""
+
+
+# Service worker template; __VERSION__ is replaced with the precache manifest
+# version, so every build with changed outputs installs a new worker.
+SERVICE_WORKER_JS = """// Service worker for the price list summary (generated, do not edit).
+// The page, data and assets are served cache-first and revalidated in the
+// background; PDFs are cached when opened so they stay available offline.
+const VERSION = '__VERSION__';
+const PRECACHE = 'precache-' + VERSION;
+const PDF_CACHE = 'pdfs';
+const MANIFEST_URL = 'precache-manifest.json';
+
+async function loadManifest() {
+    const response = await fetch(MANIFEST_URL, { cache: 'no-store' });
+    if (!response.ok) {
+        throw new Error('Failed to load precache manifest');
+    }
+    return response.json();
+}
+
+function absoluteUrl(url) {
+    return new URL(url, self.location).href;
+}
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        const manifest = await loadManifest();
+        const cache = await caches.open(PRECACHE);
+        await cache.addAll(manifest.precache.map(entry => new Request(absoluteUrl(entry.url), { cache: 'reload' })));
+        await cache.put(absoluteUrl(MANIFEST_URL), new Response(JSON.stringify(manifest), {
+            headers: { 'Content-Type': 'application/json' }
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        // Drop precaches from previous builds
+        for (const name of await caches.keys()) {
+            if (name.startsWith('precache-') && name !== PRECACHE) {
+                await caches.delete(name);
+            }
         }
-        
-        .price-list-item {
-            background: white;
-            padding: 6px 10px;
-            margin-bottom: 4px;
-            border-radius: 2px;
-            border: 1px solid #e0e0e0;
-            transition: all 0.2s ease;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            gap: 10px;
+
+        // Drop PDFs that were removed or changed since they were cached
+        const manifest = await (await caches.open(PRECACHE)).match(absoluteUrl(MANIFEST_URL)).then(r => r.json());
+        const revisions = new Map(manifest.pdfs.map(entry => [absoluteUrl(entry.url), entry.revision]));
+        const pdfCache = await caches.open(PDF_CACHE);
+        for (const request of await pdfCache.keys()) {
+            const response = await pdfCache.match(request);
+            if (revisions.get(request.url) !== response.headers.get('X-Revision')) {
+                await pdfCache.delete(request);
+            }
         }
-        
-        .price-list-item:hover {
-            border-color: #3498db;
-            box-shadow: 0 1px 4px rgba(52, 152, 219, 0.2);
-            transform: translateY(-1px);
-        }
-        
-        .price-list-link {
-            color: #3498db;
-            text-decoration: none;
-            font-weight: 500;
-            flex-grow: 1;
-            font-size: 0.9em;
-        }
-        
-        .price-list-link:hover {
-            color: #2980b9;
-            text-decoration: underline;
-        }
-        
-        .metadata {
-            display: flex;
-            gap: 8px;
-            color: #7f8c8d;
-            font-size: 0.85em;
-            flex-wrap: wrap;
-        }
-        
-        .metadata-item {
-            display: flex;
-            align-items: center;
-            gap: 4px;
-        }
-        
-        .badge {
-            background: #ecf0f1;
-            padding: 2px 6px;
-            border-radius: 8px;
-            font-size: 0.8em;
-            font-weight: 500;
-            white-space: nowrap;
-        }
-        
-        .badge.year {
-            background: #e8f5e9;
-            color: #2e7d32;
+
+        await self.clients.claim();
+    })());
+});
+
+// Serve from cache immediately, refresh the cached copy in the background
+async function staleWhileRevalidate(event, cacheKey) {
+    const cache = await caches.open(PRECACHE);
+    const cached = await cache.match(cacheKey);
+    if (!cached) {
+        return fetch(event.request);
+    }
+    event.waitUntil(fetch(event.request).then(response => {
+        if (response.ok) {
+            return cache.put(cacheKey, response);
         }
-        
-        .badge.variant {
-            background: #e3f2fd;
-            color: #1565c0;
+    }).catch(() => {}));
+    return cached;
+}
+
+// Serve PDFs from cache, otherwise fetch and keep them for offline use
+async function cachedPdf(request) {
+    const cache = await caches.open(PDF_CACHE);
+    const cached = await cache.match(request.url);
+    if (cached) {
+        return cached;
+    }
+
+    const response = await fetch(request.url);
+    const manifest = await (await caches.open(PRECACHE)).match(absoluteUrl(MANIFEST_URL)).then(r => r && r.json());
+    const entry = manifest && manifest.pdfs.find(pdf => absoluteUrl(pdf.url) === request.url);
+    if (response.ok && entry) {
+        const headers = new Headers(response.headers);
+        headers.set('X-Revision', entry.revision);
+        const body = await response.blob();
+        await cache.put(request.url, new Response(body, { status: 200, headers: headers }));
+        return new Response(body, { status: 200, headers: headers });
+    }
+    return response;
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET') {
+        return;
+    }
+
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) {
+        return;
+    }
+    url.search = '';
+    if (url.pathname.endsWith('.pdf')) {
+        event.respondWith(cachedPdf(request));
+        return;
+    }
+
+    const scope = new URL(self.registration.scope);
+    const cacheKey = url.href === scope.href ? absoluteUrl('index.html') : url.href;
+    event.respondWith(staleWhileRevalidate(event, cacheKey));
+});
+"""
+
+
+def fingerprint(content):
+    """Return the SHA-256 hex digest of bytes or text content."""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.sha256(content).hexdigest()
+
+
+def write_output(output_path, content):
+    """
+    Write a generated file together with a gzip-precompressed sibling (.gz).
+    The gzip header carries no timestamp, so unchanged content produces
+    byte-identical output between runs.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    
+    output_path = Path(output_path)
+    output_path.write_bytes(content)
+    write_gzip_sibling(output_path, content)
+    return content
+
+
+def write_gzip_sibling(output_path, content):
+    """Write the gzip-precompressed sibling (.gz) of an already written file."""
+    Path(f"{output_path}.gz").write_bytes(gzip.compress(content, compresslevel=9, mtime=0))
+
+
+def write_fingerprinted_asset(docs_path, name, content):
+    """
+    Write a static asset to docs/assets/ as <stem>.<hash>.<ext> and remove
+    previous fingerprinted versions of the same asset.
+    Returns the path relative to docs_path (used as the URL in the pages).
+    """
+    assets_path = Path(docs_path) / ASSETS_DIR
+    assets_path.mkdir(exist_ok=True)
+    
+    stem, ext = name.rsplit('.', 1)
+    asset_name = f"{stem}.{fingerprint(content)[:FINGERPRINT_LENGTH]}.{ext}"
+    
+    # Drop stale versions so the folder only holds the current build
+    for old_file in assets_path.glob(f"{stem}.*.{ext}*"):
+        if not old_file.name.startswith(asset_name):
+            old_file.unlink()
+    
+    write_output(assets_path / asset_name, content)
+    return f"{ASSETS_DIR}/{asset_name}"
+
+
+def write_asset_manifest(docs_path, outputs, output_path):
+    """
+    Write asset manifest mapping logical names to the files actually written,
+    with their hashes and sizes. Fingerprinted files are marked immutable so a
+    static server can send far-future cache headers for them.
+    """
+    docs_path = Path(docs_path)
+    manifest = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'files': {}
+    }
+    
+    for logical_name, relative_path in outputs.items():
+        file_path = docs_path / relative_path
+        content = file_path.read_bytes()
+        gzip_path = Path(f"{file_path}.gz")
+        manifest['files'][logical_name] = {
+            'path': relative_path,
+            'sha256': fingerprint(content),
+            'size': len(content),
+            'gzipPath': f"{relative_path}.gz",
+            'gzipSize': gzip_path.stat().st_size if gzip_path.exists() else None,
+            'immutable': relative_path != logical_name
         }
-        
-        .badge.date {
-            background: #fff3e0;
-            color: #e65100;
+    
+    write_output(output_path, json.dumps(manifest, indent=2, ensure_ascii=False))
+    print(f"Asset manifest generated: {output_path}")
+
+
+class PriceList:
+    """
+    One parsed price list record. Uses __slots__ and interned make/model/variant
+    strings to keep per-record overhead low, and precomputes its sort key and
+    a digest of the record (the hash of its NDJSON line, if given).
+    Instances are shared read-only by all emitters.
+    """
+    
+    __slots__ = (
+        'filename', 'basename', 'make', 'model', 'variant', 'model_year',
+        'validity_date', 'base_price', 'price_range', 'prices', 'variants',
+        'variant_counts', 'detection_confidence', 'archive', 'page_count', 'sort_key',
+        'digest'
+    )
+    
+    def __init__(self, record, digest=None):
+        self.filename = record['filename']
+        self.basename = record['basename']
+        self.make = sys.intern(record['make'])
+        self.model = sys.intern(record['model'])
+        self.variant = sys.intern(record['variant']) if record.get('variant') else None
+        self.model_year = record.get('model_year')
+        self.validity_date = record.get('validity_date')
+        self.base_price = record.get('base_price')
+        self.price_range = record.get('price_range')
+        self.prices = tuple(record.get('prices', ()))
+        self.variants = tuple(sys.intern(v) for v in record.get('variants', ()))
+        self.variant_counts = {sys.intern(v): n for v, n in record.get('variant_counts', {}).items()}
+        self.detection_confidence = record.get('detection_confidence')
+        self.archive = record.get('archive')
+        self.page_count = record.get('page_count')
+        
+        # Newest validity date first, then newest model year
+        self.sort_key = (self.validity_date or '0000-00-00', self.model_year or '0000')
+        self.digest = digest or fingerprint(json.dumps(record, sort_keys=True, ensure_ascii=False))
+    
+    @property
+    def record_id(self):
+        """Stable ID of the price list across builds (derived from its file name)."""
+        return fingerprint(f"{self.archive or ''}/{self.filename}")[:12]
+    
+    @property
+    def link_name(self):
+        """File in cenniky/ the pages link to: the PDF, or the archive containing it."""
+        return Path(self.archive or self.filename).name
+
+
+class Catalog:
+    """
+    The canonical in-memory catalog, built once from the parsed records.
+    Makes and models are sorted alphabetically and each model's price lists
+    newest first, so emitters only iterate `makes` and read `stats`.
+    model_digests holds one digest per (make, model), derived from its
+    records' digests, for the fragment cache.
+    """
+    
+    def __init__(self, records):
+        # records: (record, digest) pairs as read by read_ndjson_records()
+        groups = defaultdict(lambda: defaultdict(list))
+        for record, digest in records:
+            price_list = PriceList(record, digest)
+            groups[price_list.make][price_list.model].append(price_list)
+        
+        # [(make, [(model, (PriceList, ...)), ...]), ...]
+        self.makes = [
+            (make, [
+                (model, tuple(sorted(groups[make][model], key=attrgetter('sort_key'), reverse=True)))
+                for model in sorted(groups[make])
+            ])
+            for make in sorted(groups)
+        ]
+        self.model_digests = {
+            (make, model): fingerprint(''.join(pl.digest for pl in price_lists))
+            for make, models in self.makes
+            for model, price_lists in models
         }
         
-        .badge.price {
-            background: #f3e5f5;
-            color: #6a1b9a;
-            font-weight: 600;
-        }
+        self.total_makes = len(self.makes)
+        self.total_models = sum(len(models) for _, models in self.makes)
+        self.total_price_lists = sum(len(price_lists) for _, models in self.makes for _, price_lists in models)
+
+
+class FragmentCache:
+    """
+    Rendered HTML fragments per (make, model), persisted between runs.
+    Each fragment is stored with the model's digest (Catalog.model_digests)
+    and the whole cache is tied to a hash of this script, so only models
+    whose records (or the templates) changed are re-rendered; everything
+    else is spliced in from the cache.
+    """
+    
+    def __init__(self, cache_path):
+        self.cache_path = Path(cache_path)
+        self.renderer = fingerprint(Path(__file__).read_bytes())[:16]
+        self.fragments = {}
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+        
+        try:
+            cached = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            cached = {}
+        if cached.get('renderer') == self.renderer:
+            self.fragments = cached.get('fragments', {})
+    
+    def get(self, kind, make, model, price_lists, render, records_hash):
+        """Return the cached fragment for (make, model) or render and store it."""
+        key = f"{kind}/{make}/{model}"
+        self.used.add(key)
+        
+        entry = self.fragments.get(key)
+        if entry and entry['hash'] == records_hash:
+            self.hits += 1
+            return entry['fragment']
+        
+        self.misses += 1
+        fragment = render(model, price_lists)
+        self.fragments[key] = {'hash': records_hash, 'fragment': fragment}
+        return fragment
+    
+    def save(self):
+        """Write the cache, dropping fragments for models that no longer exist."""
+        if not self.misses and len(self.fragments) == len(self.used):
+            print(f"Fragment cache: {self.hits} reused, unchanged")
+            return
+        fragments = {key: entry for key, entry in self.fragments.items() if key in self.used}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.cache_path.with_suffix('.tmp')
+        temp_path.write_text(json.dumps({'renderer': self.renderer, 'fragments': fragments}, ensure_ascii=False), encoding='utf-8')
+        temp_path.replace(self.cache_path)
+        print(f"Fragment cache: {self.hits} reused, {self.misses} rendered")
+
+
+def render_model_html(model, price_lists):
+    """Render one model group (title and its price lists) for the static page."""
+    html = ''
+    html += f'            <div class="model-group">\n'
+    html += f'                <div class="model-title">{model}</div>\n'
+    html += f'                <ul class="price-list">\n'
+    
+    for pl in price_lists:
+        html += f'                    <li class="price-list-item">\n'
+        html += f'                        <a href="../cenniky/{pl.link_name}" class="price-list-link" target="_blank">{pl.basename}</a>\n'
+        html += f'                        <div class="metadata">\n'
         
-        .footer {
-            margin-top: 20px;
-            padding-top: 10px;
-            border-top: 1px solid #ecf0f1;
-            text-align: center;
-            color: #7f8c8d;
-            font-size: 0.8em;
-        }
+        # Display base price if available
+        if pl.base_price:
+            html += f'                            <span class="badge price">From {pl.base_price:,} €</span>\n'
+        elif pl.price_range:
+            html += f'                            <span class="badge price">{pl.price_range}</span>\n'
         
-        .stats {
-            background: #ecf0f1;
-            padding: 8px;
-            border-radius: 3px;
-            margin-bottom: 15px;
-            display: flex;
-            justify-content: space-around;
-            text-align: center;
-        }
+        if pl.model_year:
+            html += f'                            <span class="badge year">MY {pl.model_year}</span>\n'
         
-        .stat-item {
-            flex: 1;
-        }
+        if pl.variant:
+            html += f'                            <span class="badge variant">{pl.variant}</span>\n'
         
-        .stat-number {
-            font-size: 1.4em;
-            font-weight: bold;
-            color: #3498db;
-        }
+        if pl.validity_date:
+            # Format date nicely
+            try:
+                date_obj = datetime.strptime(pl.validity_date, '%Y-%m-%d')
+                formatted_date = date_obj.strftime('%d.%m.%Y')
+                html += f'                            <span class="badge date">Valid from {formatted_date}</span>\n'
+            except ValueError:
+                html += f'                            <span class="badge date">{pl.validity_date}</span>\n'
         
-        .stat-label {
-            color: #7f8c8d;
-            font-size: 0.75em;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-    </style>
+        html += f'                        </div>\n'
+        html += f'                    </li>\n'
+    
+    html += f'                </ul>\n'
+    html += f'            </div>\n'
+    
+    return html
+
+
+def slugify(text):
+    """Return a lowercase ASCII slug of text for page file names."""
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'other'
+
+
+def render_stats(stats):
+    """Render the stats bar from (number, label) pairs."""
+    html = f'        <div class="stats">\n'
+    for number, label in stats:
+        html += f'            <div class="stat-item">\n'
+        html += f'                <div class="stat-number">{number}</div>\n'
+        html += f'                <div class="stat-label">{label}</div>\n'
+        html += f'            </div>\n'
+    html += f'        </div>\n'
+    html += f'        \n'
+    return html
+
+
+def render_pager(pages, index, landing_name):
+    """Render prev / all manufacturers / next links for pages[index]."""
+    html = f'        <nav class="pager">\n'
+    if index > 0:
+        name, title = pages[index - 1][:2]
+        html += f'            <a href="{name}" rel="prev">&larr; {title}</a>\n'
+    else:
+        html += f'            <span></span>\n'
+    html += f'            <a href="{landing_name}">All manufacturers</a>\n'
+    if index + 1 < len(pages):
+        name, title = pages[index + 1][:2]
+        html += f'            <a href="{name}" rel="next">{title} &rarr;</a>\n'
+    else:
+        html += f'            <span></span>\n'
+    html += f'        </nav>\n'
+    html += f'        \n'
+    return html
+
+
+def render_static_page(title, subtitle, body, stylesheet):
+    """Wrap a static page body in the shared head, heading and footer."""
+    current_date = datetime.now().strftime('%B %d, %Y')
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <link rel="stylesheet" href="{stylesheet}">
 </head>
 <body>
     <div class="container">
-        <h1>Van Price Lists Summary</h1>
-        <p class="subtitle">Complete overview of all available price lists organized by manufacturer and model</p>
-        
-"""
-    
-    # Calculate statistics
-    total_files = sum(len(price_lists) for models_dict in grouped_data.values() for price_lists in models_dict.values())
-    total_makes = len(grouped_data)
-    total_models = sum(len(models_dict) for models_dict in grouped_data.values())
-    
-    # Add stats section
-    html += f"""        <div class="stats">
-            <div class="stat-item">
-                <div class="stat-number">{total_makes}</div>
-                <div class="stat-label">Manufacturers</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number">{total_models}</div>
-                <div class="stat-label">Models</div>
-            </div>
-            <div class="stat-item">
-                <div class="stat-number">{total_files}</div>
-                <div class="stat-label">Price Lists</div>
-            </div>
-        </div>
+        <h1>{title}</h1>
+        <p class="subtitle">{subtitle}</p>
         
-"""
-    
-    # Sort makes alphabetically
-    for make in sorted(grouped_data.keys()):
-        html += f'        <div class="make-section">\n'
-        html += f'            <div class="make-header">{make}</div>\n'
-        
-        # Sort models alphabetically
-        for model in sorted(grouped_data[make].keys()):
-            price_lists = grouped_data[make][model]
-            
-            # Sort by validity date (newest first), then by model year
-            price_lists.sort(key=lambda x: (
-                x['validity_date'] or '0000-00-00',
-                x['model_year'] or '0000'
-            ), reverse=True)
-            
-            html += f'            <div class="model-group">\n'
-            html += f'                <div class="model-title">{model}</div>\n'
-            html += f'                <ul class="price-list">\n'
-            
-            for pl in price_lists:
-                html += f'                    <li class="price-list-item">\n'
-                html += f'                        <a href="../cenniky/{Path(pl["filename"]).name}" class="price-list-link" target="_blank">{pl["basename"]}</a>\n'
-                html += f'                        <div class="metadata">\n'
-                
-                # Display base price if available
-                if pl.get('base_price'):
-                    html += f'                            <span class="badge price">From {pl["base_price"]:,} €</span>\n'
-                elif pl.get('price_range'):
-                    html += f'                            <span class="badge price">{pl["price_range"]}</span>\n'
-                
-                if pl['model_year']:
-                    html += f'                            <span class="badge year">MY {pl["model_year"]}</span>\n'
-                
-                if pl['variant']:
-                    html += f'                            <span class="badge variant">{pl["variant"]}</span>\n'
-                
-                if pl['validity_date']:
-                    # Format date nicely
-                    try:
-                        date_obj = datetime.strptime(pl['validity_date'], '%Y-%m-%d')
-                        formatted_date = date_obj.strftime('%d.%m.%Y')
-                        html += f'                            <span class="badge date">Valid from {formatted_date}</span>\n'
-                    except ValueError:
-                        html += f'                            <span class="badge date">{pl["validity_date"]}</span>\n'
-                
-                html += f'                        </div>\n'
-                html += f'                    </li>\n'
-            
-            html += f'                </ul>\n'
-            html += f'            </div>\n'
-        
-        html += f'        </div>\n'
-    
-    # Add footer
-    current_date = datetime.now().strftime('%B %d, %Y')
-    html += f"""        
+{body}        
         <div class="footer">
             <p>Generated on {current_date}</p>
             <p>This page lists all available van price lists from the cenniky folder.</p>
@@ -508,285 +2094,308 @@ def generate_html(grouped_data, output_path):
 </body>
 </html>
 """
+
+
+def lowest_base_price(price_lists):
+    """Return the lowest base price among price_lists, or None."""
+    return min((pl.base_price for pl in price_lists if pl.base_price), default=None)
+
+
+def generate_html(catalog, output_path, stylesheet, fragment_cache=None):
+    """
+    Generate the server-rendered HTML pages using the shared fingerprinted
+    stylesheet: a landing page (output_path) with precomputed stats and an
+    index of manufacturers, one page per manufacturer and, for models with
+    more than STATIC_MODEL_PAGE_SIZE price lists, one page per model. The
+    manufacturer and model pages are chained with prev/next links.
+    Returns the file names written, landing page first.
+    """
+    output_path = Path(output_path)
+    docs_path = output_path.parent
+    landing_name = output_path.name
     
-    # Write HTML file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # Plan the page sequence first so every page knows its neighbours
+    pages = []
+    used_slugs = set()
     
-    print(f"HTML summary generated: {output_path}")
+    def page_name(*parts):
+        slug = base = slugify('-'.join(parts))
+        n = 2
+        while slug in used_slugs:
+            slug = f"{base}-{n}"
+            n += 1
+        used_slugs.add(slug)
+        return f"static-{slug}.html"
+    
+    make_pages = {}
+    for make, models in catalog.makes:
+        make_pages[make] = page_name(make)
+        pages.append((make_pages[make], make, make, None))
+        for model, price_lists in models:
+            if len(price_lists) > STATIC_MODEL_PAGE_SIZE:
+                pages.append((page_name(make, model), f"{make} {model}", make, model))
+    model_pages = {(make, model): name for name, _, make, model in pages if model is not None}
+    
+    def render_model(make, model, price_lists):
+        # Unchanged models come from the fragment cache
+        if fragment_cache is not None:
+            return fragment_cache.get('html', make, model, price_lists, render_model_html,
+                                      catalog.model_digests[(make, model)])
+        return render_model_html(model, price_lists)
+    
+    # Landing page: overall stats and one entry per manufacturer
+    body = render_stats([
+        (catalog.total_makes, 'Manufacturers'),
+        (catalog.total_models, 'Models'),
+        (catalog.total_price_lists, 'Price Lists')
+    ])
+    body += f'        <div class="make-section">\n'
+    body += f'            <div class="make-header">Manufacturers</div>\n'
+    body += f'            <ul class="price-list">\n'
+    for make, models in catalog.makes:
+        make_price_lists = [pl for _, price_lists in models for pl in price_lists]
+        body += f'                <li class="price-list-item">\n'
+        body += f'                    <a href="{make_pages[make]}" class="price-list-link">{make}</a>\n'
+        body += f'                    <div class="metadata">\n'
+        lowest = lowest_base_price(make_price_lists)
+        if lowest:
+            body += f'                        <span class="badge price">From {lowest:,} €</span>\n'
+        body += f'                        <span class="badge">{len(models)} models</span>\n'
+        body += f'                        <span class="badge">{len(make_price_lists)} price lists</span>\n'
+        body += f'                    </div>\n'
+        body += f'                </li>\n'
+    body += f'            </ul>\n'
+    body += f'        </div>\n'
+    write_output(output_path, render_static_page(
+        'Van Price Lists Summary',
+        'Complete overview of all available price lists organized by manufacturer and model',
+        body, stylesheet))
+    written = [landing_name]
+    
+    # Manufacturer and model pages (makes and models come sorted from the catalog)
+    models_by_make = dict(catalog.makes)
+    for index, (name, title, make, page_model) in enumerate(pages):
+        models = models_by_make[make]
+        if page_model is not None:
+            models = [(model, price_lists) for model, price_lists in models if model == page_model]
+        
+        body = render_pager(pages, index, landing_name)
+        body += render_stats([
+            (len(models), 'Models'),
+            (sum(len(price_lists) for _, price_lists in models), 'Price Lists')
+        ])
+        body += f'        <div class="make-section">\n'
+        body += f'            <div class="make-header">{make}</div>\n'
+        for model, price_lists in models:
+            model_page = model_pages.get((make, model))
+            if page_model is None and model_page:
+                # Large models only link to their own page here
+                body += f'            <div class="model-group">\n'
+                body += f'                <div class="model-title"><a href="{model_page}">{model}</a></div>\n'
+                body += f'                <div class="metadata"><span class="badge">{len(price_lists)} price lists</span></div>\n'
+                body += f'            </div>\n'
+            else:
+                body += render_model(make, model, price_lists)
+        body += f'        </div>\n'
+        
+        write_output(docs_path / name, render_static_page(
+            title, f'Price lists for {title}', body, stylesheet))
+        written.append(name)
+    
+    # Remove pages of manufacturers and models that are gone
+    for stale_page in docs_path.glob('static-*.html*'):
+        if stale_page.name.removesuffix('.gz') not in written:
+            stale_page.unlink()
+    
+    print(f"HTML summary generated: {output_path} ({len(written)} pages)")
+    return written
+
+
+def build_price_list_json(pl):
+    """Build the data.json entry for one price list."""
+    return {
+        'id': pl.record_id,
+        'filename': Path(pl.filename).name,
+        'basename': pl.basename,
+        'basePrice': pl.base_price,
+        'priceRange': pl.price_range,
+        'modelYear': pl.model_year,
+        'variant': pl.variant,
+        'validityDate': pl.validity_date,
+        'prices': list(pl.prices),
+        'variants': list(pl.variants),
+        'variantCounts': dict(pl.variant_counts),
+        'detectionConfidence': pl.detection_confidence,
+        'archive': Path(pl.archive).name if pl.archive else None,
+        'pageCount': pl.page_count
+    }
+
+
+def build_model_json(model, price_lists):
+    """Build the data.json entry for one model and its price lists."""
+    model_data = {
+        'name': model,
+        'priceLists': []
+    }
+    
+    for pl in price_lists:
+        model_data['priceLists'].append(build_price_list_json(pl))
+    
+    return model_data
 
 
-def generate_json_data(grouped_data, output_path):
+def generate_json_data(catalog, output_path, version=None):
     """
     Generate JSON data file for use with Vue.js.
     """
-    # Convert defaultdict to regular dict for JSON serialization
     json_data = {
+        'version': version,
         'manufacturers': []
     }
     
-    # Sort makes alphabetically
-    for make in sorted(grouped_data.keys()):
+    # Makes and models come sorted from the catalog
+    for make, models in catalog.makes:
         make_data = {
             'name': make,
             'models': []
         }
         
-        # Sort models alphabetically
-        for model in sorted(grouped_data[make].keys()):
-            price_lists = grouped_data[make][model]
-            
-            # Sort by validity date (newest first), then by model year
-            price_lists.sort(key=lambda x: (
-                x['validity_date'] or '0000-00-00',
-                x['model_year'] or '0000'
-            ), reverse=True)
-            
-            model_data = {
-                'name': model,
-                'priceLists': []
-            }
-            
-            for pl in price_lists:
-                price_list_data = {
-                    'filename': Path(pl['filename']).name,
-                    'basename': pl['basename'],
-                    'basePrice': pl.get('base_price'),
-                    'priceRange': pl.get('price_range'),
-                    'modelYear': pl.get('model_year'),
-                    'variant': pl.get('variant'),
-                    'validityDate': pl.get('validity_date'),
-                    'prices': pl.get('prices', []),
-                    'variants': pl.get('variants', [])
-                }
-                model_data['priceLists'].append(price_list_data)
-            
-            make_data['models'].append(model_data)
+        # Models are rebuilt every run: building them is cheaper than loading
+        # and saving them in the fragment cache
+        for model, price_lists in models:
+            make_data['models'].append(build_model_json(model, price_lists))
         
         json_data['manufacturers'].append(make_data)
     
     # Add statistics
     json_data['stats'] = {
-        'totalManufacturers': len(grouped_data),
-        'totalModels': sum(len(models) for models in grouped_data.values()),
-        'totalPriceLists': sum(len(price_lists) for models_dict in grouped_data.values() for price_lists in models_dict.values())
+        'totalManufacturers': catalog.total_makes,
+        'totalModels': catalog.total_models,
+        'totalPriceLists': catalog.total_price_lists
     }
     
-    # Write JSON file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, indent=2, ensure_ascii=False)
+    # Write JSON file (plus gzip sibling)
+    write_output(output_path, json.dumps(json_data, indent=2, ensure_ascii=False))
     
     print(f"JSON data generated: {output_path}")
+    return json_data
 
 
-def generate_vue_html(output_path):
+def write_catalog_versions(catalog, docs_path):
+    """
+    Assign the catalog version and write delta files for repeat visitors.
+    
+    The record hashes of recent builds are kept in catalog-history.json. If
+    any record differs from the previous build, the version is incremented
+    and deltas/<old>-<new>.json (added, removed and changed price lists) is
+    written for each of the last MAX_DELTA_VERSIONS versions.
+    catalog-version.json tells the page the current version and which deltas
+    exist. Returns the current version.
+    """
+    docs_path = Path(docs_path)
+    history_path = docs_path / 'catalog-history.json'
+    deltas_path = docs_path / 'deltas'
+    
+    # Current records, flattened with their make and model
+    records = {}
+    for make, models in catalog.makes:
+        for model, price_lists in models:
+            for pl in price_lists:
+                records[pl.record_id] = dict(build_price_list_json(pl), make=make, model=model)
+    hashes = {
+        record_id: fingerprint(json.dumps(record, sort_keys=True, ensure_ascii=False))[:16]
+        for record_id, record in records.items()
+    }
+    
+    try:
+        history = json.loads(history_path.read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        history = []
+    
+    if history and history[-1]['hashes'] == hashes:
+        version = history[-1]['version']
+    else:
+        version = history[-1]['version'] + 1 if history else 1
+        history.append({'version': version, 'hashes': hashes})
+    history = history[-(MAX_DELTA_VERSIONS + 1):]
+    
+    # Deltas from each recent version to the current one
+    deltas_path.mkdir(exist_ok=True)
+    deltas = {}
+    for previous in history[:-1]:
+        old_hashes = previous['hashes']
+        delta_name = f"deltas/{previous['version']}-{version}.json"
+        delta = {
+            'from': previous['version'],
+            'to': version,
+            'added': [records[record_id] for record_id in hashes if record_id not in old_hashes],
+            'changed': [records[record_id] for record_id, record_hash in hashes.items()
+                        if record_id in old_hashes and old_hashes[record_id] != record_hash],
+            'removed': [record_id for record_id in old_hashes if record_id not in hashes]
+        }
+        write_output(docs_path / delta_name, json.dumps(delta, ensure_ascii=False, separators=(',', ':')))
+        deltas[str(previous['version'])] = delta_name
+    
+    # Drop deltas that can no longer be requested
+    for delta_file in deltas_path.glob('*.json*'):
+        if f"deltas/{delta_file.name}".removesuffix('.gz') not in deltas.values():
+            delta_file.unlink()
+    
+    write_output(history_path, json.dumps(history, separators=(',', ':')))
+    write_output(docs_path / 'catalog-version.json', json.dumps({'version': version, 'deltas': deltas}, indent=2))
+    print(f"Catalog version {version} ({len(deltas)} delta files)")
+    return version
+
+
+def build_inline_data(json_data, size_limit):
+    """
+    Choose the catalog data to embed in index.html: the whole dataset when its
+    JSON is at most size_limit bytes, otherwise just the first screen
+    (FIRST_SCREEN_PRICE_LISTS price lists) marked as partial, with full stats.
+    """
+    full_json = json.dumps(json_data, ensure_ascii=False, separators=(',', ':'))
+    if len(full_json.encode('utf-8')) <= size_limit:
+        return full_json
+    
+    first_screen = {'version': json_data['version'], 'manufacturers': [], 'stats': json_data['stats'], 'partial': True}
+    remaining = FIRST_SCREEN_PRICE_LISTS
+    for manufacturer in json_data['manufacturers']:
+        if remaining <= 0:
+            break
+        models = []
+        for model in manufacturer['models']:
+            if remaining <= 0:
+                break
+            price_lists = model['priceLists'][:remaining]
+            remaining -= len(price_lists)
+            models.append(dict(model, priceLists=price_lists))
+        first_screen['manufacturers'].append(dict(manufacturer, models=models))
+    
+    return json.dumps(first_screen, ensure_ascii=False, separators=(',', ':'))
+
+
+def generate_vue_html(output_path, stylesheet, script, worker, inline_data=None):
     """
     Generate JavaScript-based HTML page that loads data from JSON.
     Uses vanilla JavaScript instead of Vue.js to avoid CDN dependency issues.
+    CSS and JS (page script and its Web Worker) are referenced from
+    fingerprinted asset files.
+    If inline_data (a JSON string) is given, it is embedded in the page so the
+    first screen renders without waiting for data.json.
     """
-    html = """<!DOCTYPE html>
+    embedded_data = ''
+    if inline_data is not None:
+        # "</" must not appear inside a script element
+        inline_data = inline_data.replace('</', '<\\/')
+        embedded_data = f'    <script type="application/json" id="catalog-data">{inline_data}</script>\n'
+    
+    html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Van Price Lists Summary</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-            line-height: 1.4;
-            color: #333;
-            background: #f5f5f5;
-            padding: 10px;
-            font-size: 14px;
-        }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 20px;
-            border-radius: 4px;
-            box-shadow: 0 1px 4px rgba(0,0,0,0.1);
-        }
-        
-        h1 {
-            color: #2c3e50;
-            margin-bottom: 5px;
-            font-size: 1.8em;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 8px;
-        }
-        
-        .subtitle {
-            color: #7f8c8d;
-            margin-bottom: 15px;
-            font-size: 0.9em;
-        }
-        
-        .loading {
-            text-align: center;
-            padding: 20px;
-            color: #7f8c8d;
-            font-size: 1em;
-        }
-        
-        .error {
-            text-align: center;
-            padding: 20px;
-            color: #e74c3c;
-            font-size: 1em;
-        }
-        
-        .stats {
-            background: #ecf0f1;
-            padding: 8px;
-            border-radius: 3px;
-            margin-bottom: 15px;
-            display: flex;
-            justify-content: space-around;
-            text-align: center;
-        }
-        
-        .stat-item {
-            flex: 1;
-        }
-        
-        .stat-number {
-            font-size: 1.4em;
-            font-weight: bold;
-            color: #3498db;
-        }
-        
-        .stat-label {
-            color: #7f8c8d;
-            font-size: 0.75em;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .make-section {
-            margin-bottom: 20px;
-        }
-        
-        .make-header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 8px 12px;
-            border-radius: 3px;
-            margin-bottom: 10px;
-            font-size: 1.2em;
-            font-weight: bold;
-            box-shadow: 0 1px 4px rgba(0,0,0,0.15);
-        }
-        
-        .model-group {
-            margin-bottom: 12px;
-            background: #fafafa;
-            border-left: 3px solid #3498db;
-            padding: 10px;
-            border-radius: 2px;
-        }
-        
-        .model-title {
-            font-size: 1.1em;
-            color: #2c3e50;
-            margin-bottom: 8px;
-            font-weight: 600;
-        }
-        
-        .price-list {
-            list-style: none;
-        }
-        
-        .price-list-item {
-            background: white;
-            padding: 6px 10px;
-            margin-bottom: 4px;
-            border-radius: 2px;
-            border: 1px solid #e0e0e0;
-            transition: all 0.2s ease;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            gap: 10px;
-        }
-        
-        .price-list-item:hover {
-            border-color: #3498db;
-            box-shadow: 0 1px 4px rgba(52, 152, 219, 0.2);
-            transform: translateY(-1px);
-        }
-        
-        .price-list-link {
-            color: #3498db;
-            text-decoration: none;
-            font-weight: 500;
-            flex-grow: 1;
-            font-size: 0.9em;
-        }
-        
-        .price-list-link:hover {
-            color: #2980b9;
-            text-decoration: underline;
-        }
-        
-        .metadata {
-            display: flex;
-            gap: 8px;
-            color: #7f8c8d;
-            font-size: 0.85em;
-            flex-wrap: wrap;
-        }
-        
-        .badge {
-            background: #ecf0f1;
-            padding: 2px 6px;
-            border-radius: 8px;
-            font-size: 0.8em;
-            font-weight: 500;
-            white-space: nowrap;
-        }
-        
-        .badge.price {
-            background: #f3e5f5;
-            color: #6a1b9a;
-            font-weight: 600;
-        }
-        
-        .badge.year {
-            background: #e8f5e9;
-            color: #2e7d32;
-        }
-        
-        .badge.variant {
-            background: #e3f2fd;
-            color: #1565c0;
-        }
-        
-        .badge.date {
-            background: #fff3e0;
-            color: #e65100;
-        }
-        
-        .footer {
-            margin-top: 20px;
-            padding-top: 10px;
-            border-top: 1px solid #ecf0f1;
-            text-align: center;
-            color: #7f8c8d;
-            font-size: 0.8em;
-        }
-        
-        .hidden {
-            display: none;
-        }
-    </style>
+    <link rel="stylesheet" href="{stylesheet}">
 </head>
 <body>
     <div class="container">
@@ -816,6 +2425,8 @@ def generate_vue_html(output_path):
                 </div>
             </div>
             
+            <input type="search" id="filter" class="filter" placeholder="Filter by make, model, variant or year..." aria-label="Filter price lists">
+            
             <div id="manufacturers-container"></div>
             
             <div class="footer">
@@ -825,201 +2436,815 @@ def generate_vue_html(output_path):
         </div>
     </div>
 
-    <script>
-        // Format price with thousand separators
-        function formatPrice(price) {
-            return price.toLocaleString('en-US');
-        }
-        
-        // Format date from YYYY-MM-DD to DD.MM.YYYY
-        function formatDate(dateStr) {
-            if (!dateStr) return '';
-            try {
-                const [year, month, day] = dateStr.split('-');
-                return `${day}.${month}.${year}`;
-            } catch {
-                return dateStr;
-            }
-        }
-        
-        // Create badge HTML
-        function createBadge(className, text) {
-            return `<span class="badge ${className}">${text}</span>`;
-        }
-        
-        // Render the price lists
-        function renderPriceLists(data) {
-            const container = document.getElementById('manufacturers-container');
-            let html = '';
-            
-            data.manufacturers.forEach(manufacturer => {
-                html += `<div class="make-section">`;
-                html += `<div class="make-header">${manufacturer.name}</div>`;
-                
-                manufacturer.models.forEach(model => {
-                    html += `<div class="model-group">`;
-                    html += `<div class="model-title">${model.name}</div>`;
-                    html += `<ul class="price-list">`;
-                    
-                    model.priceLists.forEach(priceList => {
-                        html += `<li class="price-list-item">`;
-                        html += `<a href="../cenniky/${priceList.filename}" class="price-list-link" target="_blank">${priceList.basename}</a>`;
-                        html += `<div class="metadata">`;
-                        
-                        if (priceList.basePrice) {
-                            html += createBadge('price', `From ${formatPrice(priceList.basePrice)} €`);
-                        } else if (priceList.priceRange) {
-                            html += createBadge('price', priceList.priceRange);
-                        }
-                        
-                        if (priceList.modelYear) {
-                            html += createBadge('year', `MY ${priceList.modelYear}`);
-                        }
-                        
-                        if (priceList.variant) {
-                            html += createBadge('variant', priceList.variant);
-                        }
-                        
-                        if (priceList.validityDate) {
-                            html += createBadge('date', `Valid from ${formatDate(priceList.validityDate)}`);
-                        }
-                        
-                        html += `</div>`;
-                        html += `</li>`;
-                    });
-                    
-                    html += `</ul>`;
-                    html += `</div>`;
-                });
-                
-                html += `</div>`;
-            });
-            
-            container.innerHTML = html;
-        }
-        
-        // Load data from JSON file
-        async function loadData() {
-            try {
-                const response = await fetch('data.json');
-                if (!response.ok) {
-                    throw new Error('Failed to load data');
-                }
-                const data = await response.json();
-                
-                // Update statistics
-                document.getElementById('stat-manufacturers').textContent = data.stats.totalManufacturers;
-                document.getElementById('stat-models').textContent = data.stats.totalModels;
-                document.getElementById('stat-pricelists').textContent = data.stats.totalPriceLists;
-                
-                // Update generation date
-                const now = new Date();
-                document.getElementById('generation-date').textContent = now.toLocaleDateString('en-US', {
-                    year: 'numeric',
-                    month: 'long',
-                    day: 'numeric'
-                });
-                
-                // Render price lists
-                renderPriceLists(data);
-                
-                // Show content, hide loading
-                document.getElementById('loading').classList.add('hidden');
-                document.getElementById('content').classList.remove('hidden');
-                
-            } catch (err) {
-                document.getElementById('loading').classList.add('hidden');
-                const errorDiv = document.getElementById('error');
-                errorDiv.textContent = 'Error loading price list data: ' + err.message;
-                errorDiv.classList.remove('hidden');
-            }
-        }
-        
-        // Load data when page is ready
-        if (document.readyState === 'loading') {
-            document.addEventListener('DOMContentLoaded', loadData);
-        } else {
-            loadData();
-        }
-    </script>
+{embedded_data}    <script src="{script}" data-worker="{worker}" defer></script>
 </body>
 </html>
 """
     
-    # Write HTML file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # Write HTML file (plus gzip sibling)
+    write_output(output_path, html)
     
     print(f"JavaScript HTML generated: {output_path}")
 
 
-def main():
-    """Main function to generate the summary."""
-    # Get repository root
-    repo_root = Path(__file__).parent
+def generate_service_worker(docs_path, outputs, pdf_files, sw_path, manifest_path):
+    """
+    Generate the precache manifest (page, data and asset revisions plus PDF
+    hashes) and the service worker that uses it. The worker is versioned by
+    the manifest content, so each changed build replaces the old caches.
+    """
+    docs_path = Path(docs_path)
+    manifest = {'precache': [], 'pdfs': []}
+    
+    for relative_path in outputs.values():
+        content = (docs_path / relative_path).read_bytes()
+        manifest['precache'].append({
+            'url': relative_path,
+            'revision': fingerprint(content)[:16]
+        })
+    
+    for pdf_file in pdf_files:
+        relative_url = Path(os.path.relpath(pdf_file, docs_path)).as_posix()
+        manifest['pdfs'].append({
+            'url': quote(relative_url, safe='/()'),
+            'revision': fingerprint(Path(pdf_file).read_bytes())[:16]
+        })
+    
+    version = fingerprint(json.dumps(manifest, sort_keys=True))[:16]
+    manifest = {'version': version, **manifest}
+    
+    write_output(manifest_path, json.dumps(manifest, indent=2, ensure_ascii=False))
+    write_output(sw_path, SERVICE_WORKER_JS.replace('__VERSION__', version))
+    print(f"Service worker generated: {sw_path} (version {version})")
+
+
+class PdfSource:
+    """
+    A PDF to process: either a file on disk or a member of a zip/tar archive.
+    Archive members are read straight from the archive into memory, never
+    unpacked to disk.
+    """
+    
+    __slots__ = ('path', 'member')
+    
+    def __init__(self, path, member=None):
+        self.path = Path(path)
+        self.member = member
+    
+    @property
+    def name(self):
+        """File name of the PDF itself (without archive or folders)."""
+        return PurePosixPath(self.member).name if self.member else self.path.name
+    
+    @property
+    def display_name(self):
+        return f"{self.path.name}:{self.member}" if self.member else self.path.name
     
-    # Get all PDF files from cenniky folder
-    cenniky_path = repo_root / 'cenniky'
-    pdf_files = sorted(cenniky_path.glob('*.pdf'))
+    def read_bytes(self):
+        """Return the PDF content."""
+        if self.member is None:
+            return self.path.read_bytes()
+        
+        archive = open_archive(self.path)
+        if isinstance(archive, zipfile.ZipFile):
+            return archive.read(self.member)
+        with archive.extractfile(self.member) as member_file:
+            return member_file.read()
     
-    if not pdf_files:
-        print("No PDF files found in cenniky folder!")
+    def reader_input(self, data=None):
+        """
+        Return what to hand to pypdf: an in-memory stream of data (the PDF
+        content, if already read) or of the archive member, else the path.
+        """
+        if data is None and self.member is None:
+            return self.path
+        stream = io.BytesIO(self.read_bytes() if data is None else data)
+        stream.name = self.name
+        return stream
+
+
+def is_pdf_name(name):
+    return name.lower().endswith('.pdf')
+
+
+def is_archive_name(name):
+    return name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def open_archive(archive_path):
+    """
+    Return an open ZipFile/TarFile for the archive, reusing the handle for
+    all its members (so a compressed tar is not re-read for every member).
+    """
+    archive_path = Path(archive_path)
+    with _archive_lock:
+        archive = _open_archives.get(archive_path)
+        if archive is None:
+            if zipfile.is_zipfile(archive_path):
+                archive = zipfile.ZipFile(archive_path)
+            else:
+                archive = tarfile.open(archive_path)
+            _open_archives[archive_path] = archive
+        return archive
+
+
+def close_archives():
+    """Close all archive handles opened by open_archive()."""
+    with _archive_lock:
+        for archive in _open_archives.values():
+            archive.close()
+        _open_archives.clear()
+
+
+def list_archive_pdfs(archive_path):
+    """Return PdfSources for all PDF members of a zip or tar archive, including those in folders."""
+    archive = open_archive(archive_path)
+    if isinstance(archive, zipfile.ZipFile):
+        members = [info.filename for info in archive.infolist() if not info.is_dir()]
+    else:
+        members = [info.name for info in archive.getmembers() if info.isfile()]
+    return [PdfSource(archive_path, member) for member in members if is_pdf_name(member)]
+
+
+def collect_pdf_sources(inputs):
+    """
+    Expand input paths into PdfSources. Inputs can be PDFs, zip/tar archives
+    or folders (whose PDFs and archives are used, sorted by name).
+    """
+    sources = []
+    for input_path in inputs:
+        input_path = Path(input_path)
+        if input_path.is_dir():
+            files = sorted(path for path in input_path.iterdir()
+                           if path.is_file() and (is_pdf_name(path.name) or is_archive_name(path.name)))
+        else:
+            files = [input_path]
+        
+        for file_path in files:
+            if is_pdf_name(file_path.name):
+                sources.append(PdfSource(file_path))
+            elif zipfile.is_zipfile(file_path) or tarfile.is_tarfile(file_path):
+                sources.extend(list_archive_pdfs(file_path))
+            else:
+                print(f"Warning: Skipping {file_path} (not a PDF or zip/tar archive)")
+    return sources
+
+
+def relative_to_repo(path, repo_root):
+    """Return path relative to the repository root if it is inside it."""
+    try:
+        return str(Path(path).resolve().relative_to(Path(repo_root).resolve()))
+    except ValueError:
+        return str(path)
+
+
+def apply_detection(metadata, detection, found_in):
+    """Use a classify_text() result for a record whose filename was not recognized."""
+    if metadata['make'] != 'Unknown' or not detection or detection['confidence'] < DETECTION_MIN_CONFIDENCE:
         return
     
-    print(f"Found {len(pdf_files)} PDF files")
+    metadata['make'] = detection['make']
+    metadata['model'] = detection['model'] or metadata['model']
+    metadata['model_year'] = metadata['model_year'] or detection['model_year']
+    metadata['detection_confidence'] = detection['confidence']
+    print(f"  Detected from {found_in}: {detection['make']} {detection['model'] or ''} "
+          f"(confidence {detection['confidence']:.2f})")
+
+
+def parse_price_list(source, repo_root, quick_scan=False, data=None):
+    """
+    Parse one PDF source (filename and content) into a price list record.
+    data is the PDF content if the caller has already read it.
+    With quick_scan, only the document metadata is read instead of page text.
+    """
+    # Parse filename (archive members by their member path)
+    if source.member is None:
+        metadata = parse_filename(relative_to_repo(source.path, repo_root))
+    else:
+        metadata = parse_filename(source.member)
+        metadata['archive'] = relative_to_repo(source.path, repo_root)
     
     if not PDF_PARSING_AVAILABLE:
-        print("Warning: PDF parsing not available. Install pypdf: pip install pypdf")
-        print("Generating summary with filename-based information only...")
+        return metadata
     
-    # Parse files (both filename and content)
-    all_metadata = []
-    for i, pdf_file in enumerate(pdf_files, 1):
-        print(f"Processing ({i}/{len(pdf_files)}): {pdf_file.name}")
-        
-        # Parse filename
-        relative_path = str(pdf_file.relative_to(repo_root))
-        metadata = parse_filename(relative_path)
+    # Quick scan: fill gaps from the Info dictionary/XMP only
+    if quick_scan:
+        try:
+            info = read_pdf_info(source.reader_input(data))
+        except Exception as e:
+            print(f"  Warning: Could not read PDF metadata: {e}")
+            info = {}
+        metadata['page_count'] = info.get('page_count')
+        metadata['validity_date'] = metadata['validity_date'] or info.get('creation_date') or info.get('modification_date')
+        if info.get('title'):
+            detection = classify_text(info['title'])
+            if detection and not metadata['model_year']:
+                metadata['model_year'] = detection['model_year']
+            apply_detection(metadata, detection, 'title')
+        return metadata
+    
+    # Parse PDF content for prices and variants
+    try:
+        pdf_content = parse_pdf_content(source.reader_input(data))
+        detection = pdf_content.pop('detection')
+        metadata.update(pdf_content)
         
-        # Parse PDF content for prices and variants
-        if PDF_PARSING_AVAILABLE:
+        # Fall back to the make/model found in the text for unknown filenames
+        apply_detection(metadata, detection, 'content')
+    except Exception as e:
+        print(f"  Warning: Could not parse PDF content: {e}")
+    
+    return metadata
+
+
+class RunCheckpoints:
+    """
+    Per-file parse results of the current run, written to disk as each PDF
+    is finished so an interrupted run can be resumed. Every checkpoint is a
+    small JSON file written atomically (temp file + rename), named after the
+    PDF's resolved path (plus archive member) and holding a hash of the PDF
+    content, the scan mode and this script, so a changed PDF or parser is
+    never resumed from a stale record. Checkpoints are only read with resume.
+    """
+    
+    def __init__(self, checkpoint_dir, resume=False):
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.parser = fingerprint(Path(__file__).read_bytes())[:16]
+        self.resume = resume
+        self.resumed = 0
+        
+        if not resume:
+            self.clear()
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    
+    @staticmethod
+    def source_key(source):
+        """Identify source across input folders: resolved path plus archive member."""
+        key = str(source.path.resolve())
+        return f"{key}:{source.member}" if source.member else key
+    
+    def _path(self, source):
+        return self.checkpoint_dir / f"{fingerprint(self.source_key(source))[:FINGERPRINT_LENGTH * 2]}.json"
+    
+    def content_hash(self, data, quick_scan):
+        """Hash of the PDF content (bytes), the scan mode and this script."""
+        return fingerprint(f"{self.parser}:{int(quick_scan)}:{fingerprint(data)}")
+    
+    def load(self, source, content_hash):
+        """Return the checkpointed record for source if its hash matches, else None."""
+        try:
+            checkpoint = json.loads(self._path(source).read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            return None
+        if checkpoint.get('source') != self.source_key(source) or checkpoint.get('hash') != content_hash:
+            return None
+        self.resumed += 1
+        return checkpoint['record']
+    
+    def save(self, source, content_hash, record):
+        checkpoint_path = self._path(source)
+        temp_path = checkpoint_path.with_suffix('.tmp')
+        temp_path.write_text(json.dumps({'source': self.source_key(source), 'hash': content_hash, 'record': record},
+                                        ensure_ascii=False), encoding='utf-8')
+        temp_path.replace(checkpoint_path)
+    
+    def clear(self):
+        """Remove all checkpoints (a fresh run, or a run whose outputs were emitted)."""
+        if self.checkpoint_dir.is_dir():
+            for checkpoint_path in self.checkpoint_dir.iterdir():
+                checkpoint_path.unlink()
+
+
+def extract_records(sources, repo_root, record_queue, quick_scan=False, checkpoints=None):
+    """
+    Producer: parse each PDF and put its record on the bounded queue, so
+    extraction blocks instead of piling up results when the writer falls
+    behind. With checkpoints, PDFs already parsed by an interrupted run are
+    taken from their checkpoint and every new record is checkpointed. A PDF
+    that cannot be read is reported and skipped. Always finishes with
+    _END_OF_STREAM, or the exception that stopped it.
+    """
+    try:
+        for i, source in enumerate(sources, 1):
             try:
-                pdf_content = parse_pdf_content(pdf_file)
-                metadata.update(pdf_content)
+                # Read each PDF once; the same bytes are hashed and parsed
+                # (a second read of a compressed tar member would decompress
+                # the archive again from the start)
+                data = source.read_bytes()
+                record = None
+                if checkpoints is not None:
+                    content_hash = checkpoints.content_hash(data, quick_scan)
+                    if checkpoints.resume:
+                        record = checkpoints.load(source, content_hash)
+                
+                if record is None:
+                    print(f"Processing ({i}/{len(sources)}): {source.display_name}")
+                    record = parse_price_list(source, repo_root, quick_scan, data)
+                    if checkpoints is not None:
+                        checkpoints.save(source, content_hash, record)
+                else:
+                    print(f"Resumed ({i}/{len(sources)}): {source.display_name}")
             except Exception as e:
-                print(f"  Warning: Could not parse PDF content: {e}")
+                print(f"  Warning: Skipping {source.display_name}: {e}")
+                continue
+            record_queue.put(record)
+    except BaseException as e:
+        record_queue.put(e)
+        return
+    record_queue.put(_END_OF_STREAM)
+
+
+def stream_records_to_ndjson(sources, repo_root, output_path, quick_scan=False, checkpoints=None):
+    """
+    Parse PDFs on a producer thread and append each record to an NDJSON file
+    as soon as it is ready (one JSON object per line, flushed per record).
+    The gzip sibling (.gz) is written after the last record.
+    Returns the number of records written.
+    """
+    record_queue = queue.Queue(maxsize=RECORD_QUEUE_SIZE)
+    producer = threading.Thread(
+        target=extract_records,
+        args=(sources, repo_root, record_queue, quick_scan, checkpoints),
+        name='pdf-extractor',
+        daemon=True
+    )
+    producer.start()
+    
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        while True:
+            record = record_queue.get()
+            if record is _END_OF_STREAM:
+                break
+            if isinstance(record, BaseException):
+                raise record
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            count += 1
+    
+    producer.join()
+    
+    # Compress once the stream is complete, like the other generated files
+    write_gzip_sibling(output_path, Path(output_path).read_bytes())
+    if checkpoints is not None and checkpoints.resumed:
+        print(f"Resumed {checkpoints.resumed} records from checkpoints")
+    print(f"NDJSON stream written: {output_path} ({count} records)")
+    return count
+
+
+def read_ndjson_records(input_path):
+    """Yield (record, digest) for each price list in an NDJSON file; digest hashes its line."""
+    with open(input_path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line), fingerprint(line.rstrip('\n'))
+
+
+class DocsCache:
+    """
+    In-memory copy of the generated docs outputs for the local server.
+    Holds each file's bytes, gzip bytes and ETag, plus a flattened view of
+    data.json for the query API. The cache is reloaded when the generator
+    rewrites asset-manifest.json (always the last file written by a build).
+    """
+    
+    def __init__(self, docs_path):
+        self.docs_path = Path(docs_path)
+        self.files = {}
+        self.price_lists = []
+        self._stamp = None
+        self._lock = threading.Lock()
+    
+    def _current_stamp(self):
+        stamp_file = self.docs_path / 'asset-manifest.json'
+        if not stamp_file.exists():
+            stamp_file = self.docs_path / 'data.json'
+        try:
+            stat = stamp_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def refresh(self):
+        """Reload all outputs if the generator has written a new build."""
+        stamp = self._current_stamp()
+        if stamp == self._stamp:
+            return
+        
+        with self._lock:
+            if stamp == self._stamp:
+                return
+            self._load()
+            self._stamp = stamp
+    
+    def _load(self):
+        files = {}
+        for file_path in self.docs_path.rglob('*'):
+            if not file_path.is_file() or file_path.suffix == '.gz' or file_path.name.startswith('.'):
+                continue
+            
+            relative_path = file_path.relative_to(self.docs_path).as_posix()
+            content = file_path.read_bytes()
+            gzip_path = Path(f"{file_path}.gz")
+            if gzip_path.exists():
+                gzip_content = gzip_path.read_bytes()
+            else:
+                gzip_content = gzip.compress(content, compresslevel=6, mtime=0)
+            
+            content_type = mimetypes.guess_type(file_path.name)[0] or 'application/octet-stream'
+            if content_type.startswith('text/') or content_type in ('application/json', 'application/javascript'):
+                content_type += '; charset=utf-8'
+            
+            files[relative_path] = {
+                'content': content,
+                'gzip': gzip_content,
+                'etag': f'"{fingerprint(content)[:16]}"',
+                'type': content_type,
+                'immutable': relative_path.startswith(f"{ASSETS_DIR}/")
+            }
         
-        all_metadata.append(metadata)
+        price_lists = []
+        data_file = files.get('data.json')
+        if data_file:
+            try:
+                data = json.loads(data_file['content'])
+            except ValueError as e:
+                print(f"Warning: Could not parse data.json: {e}")
+                data = {}
+            for manufacturer in data.get('manufacturers', []):
+                for model in manufacturer['models']:
+                    for price_list in model['priceLists']:
+                        price_lists.append(dict(price_list, make=manufacturer['name'], model=model['name']))
+        
+        self.files = files
+        self.price_lists = price_lists
+        print(f"Loaded {len(files)} files and {len(price_lists)} price lists into cache")
     
-    # Group by make and model
-    grouped_data = defaultdict(lambda: defaultdict(list))
-    for metadata in all_metadata:
-        make = metadata['make']
-        model = metadata['model']
-        grouped_data[make][model].append(metadata)
+    def get(self, relative_path):
+        self.refresh()
+        return self.files.get(relative_path)
+    
+    def query(self, make=None, model=None, min_price=None, max_price=None):
+        """Filter the catalog by make/model (case-insensitive) and base price range."""
+        self.refresh()
+        results = []
+        for price_list in self.price_lists:
+            if make and price_list['make'].casefold() != make.casefold():
+                continue
+            if model and price_list['model'].casefold() != model.casefold():
+                continue
+            if min_price is not None or max_price is not None:
+                base_price = price_list.get('basePrice')
+                if base_price is None:
+                    continue
+                if min_price is not None and base_price < min_price:
+                    continue
+                if max_price is not None and base_price > max_price:
+                    continue
+            results.append(price_list)
+        return results
+
+
+class DocsRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves the generated docs from DocsCache, the PDFs from cenniky/ (with
+    range requests) and the /api/pricelists query endpoint.
+    """
+    
+    server_version = 'VanPriceLists/1.0'
+    
+    def do_GET(self):
+        self._handle(send_body=True)
+    
+    def do_HEAD(self):
+        self._handle(send_body=False)
+    
+    def _handle(self, send_body):
+        url = urlsplit(self.path)
+        path = unquote(url.path)
+        
+        if path == '/api/pricelists':
+            self._send_query(parse_qs(url.query), send_body)
+        elif path.startswith('/cenniky/'):
+            self._send_pdf(path[len('/cenniky/'):], send_body)
+        else:
+            relative_path = path.lstrip('/') or 'index.html'
+            if relative_path.endswith('/'):
+                relative_path += 'index.html'
+            self._send_cached(relative_path, send_body)
+    
+    def _send_bytes(self, status, content, content_type, headers=None, send_body=True):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(content)
+    
+    def _send_error_json(self, status, message, send_body=True):
+        content = json.dumps({'error': message}).encode('utf-8')
+        self._send_bytes(status, content, 'application/json; charset=utf-8', send_body=send_body)
+    
+    def _accepts_gzip(self):
+        """Does Accept-Encoding allow gzip (by name or via *) with a q-value above 0?"""
+        qualities = {}
+        for coding in self.headers.get('Accept-Encoding', '').split(','):
+            name, *params = [part.strip() for part in coding.split(';')]
+            if not name:
+                continue
+            quality = 1.0
+            for param in params:
+                key, _, value = param.partition('=')
+                if key.strip().lower() == 'q':
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            qualities[name.lower()] = quality
+        
+        quality = qualities.get('gzip', qualities.get('x-gzip', qualities.get('*', 0.0)))
+        return quality > 0
+    
+    def _send_cached(self, relative_path, send_body):
+        entry = self.server.docs_cache.get(relative_path)
+        if entry is None:
+            self.send_error(404, 'File not found')
+            return
+        
+        # Compressed and identity responses are different representations,
+        # so they get different ETags
+        use_gzip = self._accepts_gzip()
+        etag = entry['etag'][:-1] + '-gz"' if use_gzip else entry['etag']
+        headers = {
+            'ETag': etag,
+            'Vary': 'Accept-Encoding',
+            'Cache-Control': 'public, max-age=31536000, immutable' if entry['immutable'] else 'no-cache'
+        }
+        
+        if etag in self.headers.get('If-None-Match', ''):
+            self.send_response(304)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+        
+        content = entry['content']
+        if use_gzip:
+            content = entry['gzip']
+            headers['Content-Encoding'] = 'gzip'
+        
+        self._send_bytes(200, content, entry['type'], headers, send_body)
+    
+    def _send_pdf(self, name, send_body):
+        pdf_root = self.server.pdf_root
+        pdf_path = pdf_root / name
+        # Only plain file names inside cenniky/ are served
+        if Path(name).name != name or not pdf_path.is_file():
+            self.send_error(404, 'File not found')
+            return
+        
+        stat = pdf_path.stat()
+        size = stat.st_size
+        etag = f'"{stat.st_mtime_ns:x}-{size:x}"'
+        headers = {
+            'ETag': etag,
+            'Accept-Ranges': 'bytes',
+            'Cache-Control': 'no-cache'
+        }
+        
+        if etag in self.headers.get('If-None-Match', ''):
+            self.send_response(304)
+            for header_name, value in headers.items():
+                self.send_header(header_name, value)
+            self.end_headers()
+            return
+        
+        start, end = 0, size - 1
+        status = 200
+        range_header = self.headers.get('Range')
+        if range_header and self.headers.get('If-Range', etag) == etag:
+            range_match = re.fullmatch(r'bytes=(\d*)-(\d*)', range_header.strip())
+            if range_match and any(range_match.groups()):
+                first, last = range_match.groups()
+                if first:
+                    start = int(first)
+                    end = min(int(last), size - 1) if last else size - 1
+                else:
+                    # Suffix range: last N bytes
+                    start = max(size - int(last), 0)
+                if start > end or start >= size:
+                    self.send_response(416)
+                    self.send_header('Content-Range', f'bytes */{size}')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                status = 206
+                headers['Content-Range'] = f'bytes {start}-{end}/{size}'
+        
+        length = end - start + 1
+        self.send_response(status)
+        self.send_header('Content-Type', mimetypes.guess_type(name)[0] or 'application/octet-stream')
+        self.send_header('Content-Length', str(length))
+        for header_name, value in headers.items():
+            self.send_header(header_name, value)
+        self.end_headers()
+        
+        if not send_body:
+            return
+        with open(pdf_path, 'rb') as f:
+            f.seek(start)
+            remaining = length
+            while remaining > 0:
+                chunk = f.read(min(64 * 1024, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+    
+    def _send_query(self, params, send_body):
+        def param(name):
+            values = params.get(name)
+            return values[0] if values else None
+        
+        try:
+            min_price = int(param('min_price')) if param('min_price') else None
+            max_price = int(param('max_price')) if param('max_price') else None
+        except ValueError:
+            self._send_error_json(400, 'min_price and max_price must be integers', send_body)
+            return
+        
+        results = self.server.docs_cache.query(
+            make=param('make'),
+            model=param('model'),
+            min_price=min_price,
+            max_price=max_price
+        )
+        content = json.dumps({'count': len(results), 'priceLists': results}, ensure_ascii=False).encode('utf-8')
+        self._send_bytes(200, content, 'application/json; charset=utf-8', {'Cache-Control': 'no-cache'}, send_body)
+
+
+def serve(docs_path, pdf_root, host='127.0.0.1', port=8000):
+    """
+    Serve the generated docs from memory, with the PDFs under /cenniky/ so the
+    relative links in the pages keep working.
+    """
+    server = ThreadingHTTPServer((host, port), DocsRequestHandler)
+    server.docs_cache = DocsCache(docs_path)
+    server.pdf_root = Path(pdf_root)
+    server.docs_cache.refresh()
+    
+    print(f"Serving {docs_path} on http://{host}:{port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping server")
+    finally:
+        server.server_close()
+
+
+def build_summary(repo_root, inline_data_limit=None, memprofile=None, inputs=None, quick_scan=False, resume=False):
+    """
+    Parse all price lists and generate the docs outputs.
+    inputs are PDFs, zip/tar archives or folders (default: the cenniky folder).
+    With quick_scan, only PDF metadata is read (no prices or variants).
+    With resume, PDFs checkpointed by an interrupted run are not parsed again.
+    With memprofile (a report path), memory is profiled per file and stage.
+    """
+    global _memory_profiler
+    if memprofile:
+        _memory_profiler = MemoryProfiler()
+    
+    # Get all PDF files (and PDFs inside archives) from the inputs
+    sources = collect_pdf_sources(inputs or [repo_root / 'cenniky'])
+    
+    if not sources:
+        print("No PDF files found in the inputs!")
+        return
+    
+    print(f"Found {len(sources)} PDF files")
+    
+    if not PDF_PARSING_AVAILABLE:
+        print("Warning: PDF parsing not available. Install pypdf: pip install pypdf")
+        print("Generating summary with filename-based information only...")
     
     # Create docs folder
     docs_path = repo_root / 'docs'
     docs_path.mkdir(exist_ok=True)
     
+    # Parse files (both filename and content), streaming each record to NDJSON
+    # (checkpointing each one so an interrupted run can be resumed)
+    ndjson_output_file = docs_path / 'pricelists.ndjson'
+    checkpoints = RunCheckpoints(repo_root / CACHE_DIR / 'checkpoints', resume)
+    try:
+        stream_records_to_ndjson(sources, repo_root, ndjson_output_file, quick_scan, checkpoints)
+    finally:
+        close_archives()
+    
+    # Build the catalog (grouped by make and model) from the stream, once
+    catalog = Catalog(read_ndjson_records(ndjson_output_file))
+    
+    # Write fingerprinted CSS/JS assets shared by the pages
+    stylesheet = write_fingerprinted_asset(docs_path, 'summary.css', SUMMARY_CSS)
+    script = write_fingerprinted_asset(docs_path, 'summary.js', SUMMARY_JS)
+    worker = write_fingerprinted_asset(docs_path, 'summary-worker.js', SUMMARY_WORKER_JS)
+    
+    # Rendered fragments from the previous run, reused for unchanged models
+    fragment_cache = FragmentCache(repo_root / CACHE_DIR / 'fragments.json')
+    
+    # Catalog version and delta files against recent builds
+    version = write_catalog_versions(catalog, docs_path)
+    
     # Generate JSON data file
     json_output_file = docs_path / 'data.json'
-    generate_json_data(grouped_data, json_output_file)
+    with profile_stage('generate_json_data', 'emit'):
+        json_data = generate_json_data(catalog, json_output_file, version)
     
-    # Generate JavaScript-based HTML page
+    # Generate JavaScript-based HTML page, optionally with the catalog inlined
+    inline_data = None
+    if inline_data_limit is not None:
+        inline_data = build_inline_data(json_data, inline_data_limit)
     js_output_file = docs_path / 'index.html'
-    generate_vue_html(js_output_file)
+    with profile_stage('generate_vue_html', 'emit'):
+        generate_vue_html(js_output_file, stylesheet, script, worker, inline_data)
     
-    # Also keep the old server-rendered HTML for comparison
+    # Also keep the server-rendered HTML, paginated per manufacturer
     old_html_file = docs_path / 'index-static.html'
-    generate_html(grouped_data, old_html_file)
+    with profile_stage('generate_html', 'emit'):
+        static_pages = generate_html(catalog, old_html_file, stylesheet, fragment_cache)
+    fragment_cache.save()
+    
+    # Service worker and precache manifest for offline use
+    outputs = {
+        'summary.css': stylesheet,
+        'summary.js': script,
+        'summary-worker.js': worker,
+        'data.json': 'data.json',
+        'index.html': 'index.html',
+        **{page: page for page in static_pages}
+    }
+    sw_file = docs_path / 'sw.js'
+    pdf_files = [source.path for source in sources if source.member is None]
+    generate_service_worker(docs_path, outputs, pdf_files, sw_file, docs_path / 'precache-manifest.json')
+    
+    # Record what was written so a server can cache and serve compressed files
+    manifest_file = docs_path / 'asset-manifest.json'
+    write_asset_manifest(docs_path, {
+        **outputs,
+        'pricelists.ndjson': 'pricelists.ndjson',
+        'sw.js': 'sw.js',
+        'precache-manifest.json': 'precache-manifest.json',
+        'catalog-version.json': 'catalog-version.json'
+    }, manifest_file)
+    
+    # Everything was emitted, so the next run starts from scratch
+    checkpoints.clear()
     
     print(f"\nSummary:")
-    print(f"  Total manufacturers: {len(grouped_data)}")
-    print(f"  Total models: {sum(len(models) for models in grouped_data.values())}")
+    print(f"  Total manufacturers: {catalog.total_makes}")
+    print(f"  Total models: {catalog.total_models}")
+    print(f"  NDJSON stream: {ndjson_output_file}")
     print(f"  JSON data: {json_output_file}")
     print(f"  JavaScript HTML: {js_output_file}")
     print(f"  Static HTML: {old_html_file}")
+    print(f"  Service worker: {sw_file}")
+    print(f"  Asset manifest: {manifest_file}")
+    
+    if _memory_profiler is not None:
+        _memory_profiler.write_report(memprofile)
+        _memory_profiler = None
+
+
+def main(argv=None):
+    """Main function: generate the summary, or serve it with `serve`."""
+    # Get repository root
+    repo_root = Path(__file__).parent
+    
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    subparsers = parser.add_subparsers(dest='command')
+    parser.add_argument('--inline-data-limit', type=int, metavar='BYTES',
+                        help='embed the catalog in index.html: whole dataset up to BYTES, '
+                             'otherwise only the first screen (default: no inlining)')
+    parser.add_argument('--input', action='append', dest='inputs', metavar='PATH',
+                        help='PDF, zip/tar archive or folder to read (repeatable; default: cenniky/)')
+    parser.add_argument('--quick-scan', action='store_true',
+                        help='read only PDF metadata (Info dictionary/XMP, page count), not page text')
+    parser.add_argument('--resume', action='store_true',
+                        help='skip PDFs already parsed by an interrupted run (matched by content hash)')
+    parser.add_argument('--memprofile', nargs='?', const='memprofile-report.txt', metavar='REPORT',
+                        help='record peak RSS and top allocators per file and stage, '
+                             'and write a ranked report (default: memprofile-report.txt)')
+    serve_parser = subparsers.add_parser('serve', help='serve the generated docs and PDFs locally')
+    serve_parser.add_argument('--host', default='127.0.0.1', help='address to bind (default: 127.0.0.1)')
+    serve_parser.add_argument('--port', type=int, default=8000, help='port to listen on (default: 8000)')
+    args = parser.parse_args(argv)
+    
+    if args.command == 'serve':
+        serve(repo_root / 'docs', repo_root / 'cenniky', host=args.host, port=args.port)
+    else:
+        build_summary(repo_root, inline_data_limit=args.inline_data_limit, memprofile=args.memprofile,
+                      inputs=args.inputs, quick_scan=args.quick_scan, resume=args.resume)
 
 
 if __name__ == '__main__':